@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Callable, Dict, List, Optional, Tuple, Union
+
+
+def _get_umask() -> int:
+    # The umask can only be read by setting it, so it is restored right away.
+    _umask = os.umask(0o022)
+    os.umask(_umask)
+    return _umask
+
+
+def atomic_write(outfile: Path, write: Callable[[IO[bytes]], None]) -> None:
+    """
+    Writes a file through a temporary file in the same directory which then replaces `outfile`, so a partially written `outfile` never exists.
+
+    Args:
+        outfile (Path): File path to write.
+        write (Callable[[IO[bytes]], None]): Method writing the content into the given binary stream.
+    """
+    outfile.parent.mkdir(parents=True, exist_ok=True)
+    _fd, _tmp_name = tempfile.mkstemp(
+        dir=outfile.parent, prefix=f".{outfile.name}.", suffix=".tmp"
+    )
+    try:
+        # `mkstemp` creates the file as owner-only, `outfile` gets the mode of any
+        # regular new file instead.
+        os.chmod(_tmp_name, 0o666 & ~_get_umask())
+        with os.fdopen(_fd, "wb") as _tmp_stream:
+            write(_tmp_stream)
+            _tmp_stream.flush()
+            os.fsync(_tmp_stream.fileno())
+        os.replace(_tmp_name, outfile)
+    except BaseException:
+        Path(_tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class BatchJobManifest:
+    """
+    Local record of the chunks of a batch job which have already been completed, so that the job can be resumed after an interruption.
+    """
+
+    manifest_file: Path
+    job_signature: Dict
+    completed_chunks: Dict[str, Dict]
+
+    def __init__(self) -> None:
+        self.manifest_file = None
+        self.job_signature = {}
+        self.completed_chunks = {}
+
+    @classmethod
+    def from_file(
+        cls, manifest_file: Path, job_signature: Optional[Dict] = None
+    ) -> BatchJobManifest:
+        """
+        Initializes a `BatchJobManifest` from the given `manifest_file`, when it does not exist yet an empty manifest is created.
+
+        Args:
+            manifest_file (Path): Location of the (JSON) manifest.
+            job_signature (Optional[Dict], optional): JSON serializable description of the job (inputs, parameters) the manifest belongs to. Defaults to None, reading an existing manifest whatever job it belongs to.
+
+        Raises:
+            ValueError: When the existing manifest belongs to a job with a different signature, or when no `job_signature` is given and the manifest does not exist.
+
+        Returns:
+            BatchJobManifest: Instance with the already completed chunks.
+        """
+        _manifest = cls()
+        _manifest.manifest_file = manifest_file
+        _manifest.job_signature = job_signature
+        if not manifest_file.is_file():
+            if job_signature is None:
+                raise ValueError(f"Manifest {manifest_file} not found.")
+            return _manifest
+
+        _content = json.loads(manifest_file.read_text())
+        if job_signature is None:
+            _manifest.job_signature = _content["job_signature"]
+        elif _content["job_signature"] != job_signature:
+            raise ValueError(
+                f"Manifest {manifest_file} belongs to a different job, remove it or choose another output directory."
+            )
+        _manifest.completed_chunks = _content["completed_chunks"]
+        return _manifest
+
+    @staticmethod
+    def _get_chunk_key(start: int, end: int) -> str:
+        return f"{start}-{end}"
+
+    def is_completed(self, start: int, end: int) -> bool:
+        """
+        Whether the chunk of inputs `[start, end)` was completed and all its outputs still exist.
+
+        Args:
+            start (int): First index of the chunk.
+            end (int): Index after the last one of the chunk.
+
+        Returns:
+            bool: Chunk was completed.
+        """
+        _chunk = self.completed_chunks.get(self._get_chunk_key(start, end), None)
+        if not _chunk:
+            return False
+        return all(
+            (self.manifest_file.parent / _output).is_file()
+            for _name, _output in _chunk.items()
+            if _name not in ["start", "end"]
+        )
+
+    def mark_completed(
+        self,
+        start: int,
+        end: int,
+        output_file: Path,
+        extra_outputs: Optional[Dict[str, Path]] = None,
+    ) -> None:
+        """
+        Records the chunk of inputs `[start, end)` as completed and saves the manifest.
+
+        Args:
+            start (int): First index of the chunk.
+            end (int): Index after the last one of the chunk.
+            output_file (Path): File where the output of the chunk was written.
+            extra_outputs (Optional[Dict[str, Path]], optional): Other files written for the chunk, by name (other than `start`, `end` and `output`). Defaults to None.
+        """
+        _outputs = dict(output=output_file, **(extra_outputs or {}))
+        self.completed_chunks[self._get_chunk_key(start, end)] = dict(
+            start=start,
+            end=end,
+            **{
+                _name: str(_file.relative_to(self.manifest_file.parent))
+                for _name, _file in _outputs.items()
+            },
+        )
+        self.save()
+
+    def covers(self, n_items: int) -> bool:
+        """
+        Whether the completed chunks (with existing outputs) cover all the items `[0, n_items)`.
+
+        Args:
+            n_items (int): Total amount of items of the job.
+
+        Returns:
+            bool: All items were processed.
+        """
+        _covered = 0
+        for _chunk in sorted(self.completed_chunks.values(), key=lambda x: x["start"]):
+            if _chunk["start"] != _covered or not self.is_completed(
+                _chunk["start"], _chunk["end"]
+            ):
+                return False
+            _covered = _chunk["end"]
+        return _covered == n_items
+
+    def get_outputs(self, name: str = "output") -> List[Path]:
+        """
+        Gets the output files of the completed chunks, sorted by their first input index.
+
+        Args:
+            name (str, optional): Name of the output, as given in `extra_outputs` when marked completed. Defaults to "output" (the main output of each chunk).
+
+        Raises:
+            ValueError: When a completed chunk has no output with the given `name`.
+
+        Returns:
+            List[Path]: Output files.
+        """
+        _chunks = sorted(self.completed_chunks.values(), key=lambda x: x["start"])
+        if any(name not in _chunk for _chunk in _chunks):
+            raise ValueError(
+                f"Not all chunks in {self.manifest_file} have a '{name}' output."
+            )
+        return [self.manifest_file.parent / _chunk[name] for _chunk in _chunks]
+
+    def save(self) -> None:
+        """
+        Atomically writes the manifest to its `manifest_file`.
+        """
+        _content = dict(
+            job_signature=self.job_signature, completed_chunks=self.completed_chunks
+        )
+        atomic_write(
+            self.manifest_file,
+            lambda stream: stream.write(json.dumps(_content, indent=4).encode()),
+        )
+
+
+def run_chunked_job(
+    n_items: int,
+    chunk_size: int,
+    manifest: BatchJobManifest,
+    process_chunk: Callable[[int, int], Union[Path, Tuple[Path, Dict[str, Path]]]],
+) -> List[Path]:
+    """
+    Processes `n_items` in chunks of `chunk_size`, skipping the chunks already completed in the `manifest`.
+
+    Args:
+        n_items (int): Total amount of items to process.
+        chunk_size (int): Maximum amount of items per chunk.
+        manifest (BatchJobManifest): Manifest where the progress is recorded.
+        process_chunk (Callable[[int, int], Union[Path, Tuple[Path, Dict[str, Path]]]]): Method processing the items `[start, end)` and returning its (atomically written) output file, optionally together with its other output files by name.
+
+    Raises:
+        ValueError: When `chunk_size` is not greater than 0.
+
+    Returns:
+        List[Path]: Output files of all the chunks, sorted by their first item.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size should be greater than 0, {chunk_size} given.")
+    # Saved upfront, so a job without items is recorded as well.
+    manifest.save()
+    for _start in range(0, n_items, chunk_size):
+        _end = min(_start + chunk_size, n_items)
+        if manifest.is_completed(_start, _end):
+            continue
+        _outputs = process_chunk(_start, _end)
+        if isinstance(_outputs, Path):
+            _outputs = (_outputs, None)
+        manifest.mark_completed(_start, _end, *_outputs)
+    return manifest.get_outputs()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def deduplicate_inputs(
+    values: np.ndarray, tolerance: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Groups the rows of `values` that are identical once quantized to the given `tolerance`.
+
+    Args:
+        values (np.ndarray): Array of shape `(n, n_values)` where each row represents a dike input.
+        tolerance (float, optional): Rows whose values round to the same multiple of `tolerance` are considered equal. Defaults to 0.0 (exact matches).
+
+    Raises:
+        ValueError: When a negative `tolerance` is given, or when quantizing to a `tolerance` with non-finite (or too large) values.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The first row of each group (`(n_unique, n_values)`) and, for each given row, the index of its group (`(n,)`).
+    """
+    if tolerance < 0:
+        raise ValueError("Tolerance should be positive, {} given".format(tolerance))
+
+    _values = np.asarray(values, dtype=np.float64)
+    if _values.ndim != 2:
+        raise ValueError(
+            "Expected values of shape (n, n_values), {} provided".format(_values.shape)
+        )
+    # Adding 0.0 turns -0.0 into 0.0, as rows are compared by their bytes.
+    _keys = _values + 0.0
+    if tolerance > 0:
+        # Quantized keys stay floats, a cast to integers would wrap around.
+        with np.errstate(over="ignore"):
+            _keys = np.round(_values / tolerance) + 0.0
+        if not np.isfinite(_keys).all():
+            raise ValueError(
+                "Values should be finite and quantizable to the tolerance {}".format(
+                    tolerance
+                )
+            )
+
+    # Each row is viewed as a single opaque item so all rows are compared at once.
+    _row_keys = np.ascontiguousarray(_keys).view(
+        np.dtype((np.void, _keys.dtype.itemsize * _keys.shape[1]))
+    )
+    _, _first_idx, _inverse = np.unique(
+        _row_keys.ravel(), return_index=True, return_inverse=True
+    )
+    return _values[_first_idx], _inverse.ravel()
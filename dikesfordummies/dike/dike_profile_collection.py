@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Optional
+
+import numpy as np
+
+from dikesfordummies.dike.dike_profile_protocol import DikeProfileProtocol
+
+if TYPE_CHECKING:
+    from dikesfordummies.dike.dike_profile_type import DikeProfileType
+
+
+class DikeProfileCollection:
+    """
+    Compact representation of many dike profiles of the same `DikeProfileType`.
+
+    The distinct geometries are stored in a single array of shape `(n_geometries, n_points, 2)`
+    and each profile refers to its geometry through `geometry_indices`, so repeated sections share
+    their characteristic points. Concrete `DikeProfileProtocol` instances are only created when
+    explicitely requested.
+    """
+
+    profile_type: DikeProfileType
+    geometries: np.ndarray
+    geometry_indices: np.ndarray
+
+    def __init__(
+        self,
+        profile_type: DikeProfileType,
+        geometries: np.ndarray,
+        geometry_indices: Optional[np.ndarray] = None,
+    ) -> None:
+        if geometry_indices is None:
+            geometry_indices = np.arange(len(geometries))
+        self.profile_type = profile_type
+        self.geometries = geometries
+        self.geometry_indices = geometry_indices
+
+    def __len__(self) -> int:
+        return len(self.geometry_indices)
+
+    def __getitem__(self, idx: int) -> DikeProfileProtocol:
+        return self.profile_type.profile_class.from_tuple_list(
+            list(map(tuple, self.geometries[self.geometry_indices[idx]].tolist()))
+        )
+
+    def __iter__(self) -> Iterator[DikeProfileProtocol]:
+        return (self[idx] for idx in range(len(self)))
+
+    @property
+    def characteristic_points(self) -> np.ndarray:
+        """
+        The characteristic points of every profile in the collection. Shared geometries are copied, prefer `geometries` when possible.
+
+        Returns:
+            np.ndarray: Array of shape `(n_profiles, n_points, 2)`.
+        """
+        return self.geometries[self.geometry_indices]
+
+    @property
+    def heights(self) -> np.ndarray:
+        """
+        The greatest `y coordinate` of each profile in the collection.
+
+        Returns:
+            np.ndarray: Highest y coordinate of each dike.
+        """
+        return self.geometries[:, :, 1].max(axis=1)[self.geometry_indices]
+
+    @property
+    def widths(self) -> np.ndarray:
+        """
+        The `x coordinate` of the last characteristic point of each profile in the collection.
+
+        Returns:
+            np.ndarray: Highest x coordinate of each dike.
+        """
+        return self.geometries[:, -1, 0][self.geometry_indices]
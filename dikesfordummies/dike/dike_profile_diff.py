@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from dikesfordummies.dike.dike_profile_collection import DikeProfileCollection
+
+
+class DikeProfileDiff:
+    """
+    Differences between two sets of aligned dike profiles, one value (or row) per section.
+    """
+
+    section_ids: np.ndarray
+    max_vertical_offset: np.ndarray
+    area_difference: np.ndarray
+    changed_points: Optional[np.ndarray]
+    only_in_base: np.ndarray
+    only_in_other: np.ndarray
+    tolerance: float
+
+    def __init__(self) -> None:
+        self.section_ids = np.empty(0)
+        self.max_vertical_offset = np.empty(0)
+        self.area_difference = np.empty(0)
+        self.changed_points = None
+        self.only_in_base = np.empty(0)
+        self.only_in_other = np.empty(0)
+        self.tolerance = 0.0
+
+    def __len__(self) -> int:
+        return len(self.section_ids)
+
+    @property
+    def changed(self) -> np.ndarray:
+        """
+        Whether each section changed beyond the `tolerance`: any of its points when both layouts match, otherwise its maximum vertical offset (the area difference is not comparable to a coordinate tolerance).
+
+        Returns:
+            np.ndarray: Boolean mask of shape `(n_sections,)`.
+        """
+        if self.changed_points is None:
+            return self.max_vertical_offset > self.tolerance
+        return self.changed_points.any(axis=1)
+
+
+def _get_areas(points: np.ndarray) -> np.ndarray:
+    # Trapezoidal area between each profile and the reference level (y = 0).
+    _x = points[:, :, 0]
+    _y = points[:, :, 1]
+    return (np.diff(_x, axis=1) * (_y[:, 1:] + _y[:, :-1]) / 2).sum(axis=1)
+
+
+def _interpolate(points: np.ndarray, x_query: np.ndarray) -> np.ndarray:
+    # Row-wise equivalent of `np.interp`, the x coordinates of each profile are non-decreasing.
+    _x = points[:, :, 0]
+    _y = points[:, :, 1]
+    _idx = (_x[:, np.newaxis, :] <= x_query[:, :, np.newaxis]).sum(axis=2) - 1
+    _idx = np.clip(_idx, 0, _x.shape[1] - 2)
+    _x_left = np.take_along_axis(_x, _idx, axis=1)
+    _x_right = np.take_along_axis(_x, _idx + 1, axis=1)
+    _y_left = np.take_along_axis(_y, _idx, axis=1)
+    _y_right = np.take_along_axis(_y, _idx + 1, axis=1)
+    _dx = _x_right - _x_left
+    _ratio = np.divide(
+        x_query - _x_left, _dx, out=np.ones_like(_dx), where=_dx != 0
+    ).clip(0, 1)
+    return _y_left + _ratio * (_y_right - _y_left)
+
+
+def diff_characteristic_points(
+    base_points: np.ndarray,
+    other_points: np.ndarray,
+    section_ids: Optional[np.ndarray] = None,
+    tolerance: float = 0.0,
+) -> DikeProfileDiff:
+    """
+    Compares two arrays of characteristic points already aligned by section.
+
+    Args:
+        base_points (np.ndarray): Array of shape `(n, n_points_base, 2)`.
+        other_points (np.ndarray): Array of shape `(n, n_points_other, 2)`.
+        section_ids (Optional[np.ndarray], optional): Identifier (id or chainage) of each section. Defaults to their position.
+        tolerance (float, optional): Coordinate differences up to this value are not considered a change. Defaults to 0.0.
+
+    Raises:
+        ValueError: When the amount of sections does not match.
+
+    Returns:
+        DikeProfileDiff: Per section differences. `changed_points` is only set when both arrays have the same amount of points per profile.
+    """
+    if len(base_points) != len(other_points):
+        raise ValueError(
+            "Expected the same amount of sections, {} and {} provided".format(
+                len(base_points), len(other_points)
+            )
+        )
+    if section_ids is None:
+        section_ids = np.arange(len(base_points))
+
+    # Both profiles are evaluated at all their breakpoints, where the vertical offset is maximal.
+    _x_query = np.concatenate([base_points[:, :, 0], other_points[:, :, 0]], axis=1)
+    _offset = np.abs(
+        _interpolate(other_points, _x_query) - _interpolate(base_points, _x_query)
+    )
+
+    _diff = DikeProfileDiff()
+    _diff.section_ids = np.asarray(section_ids)
+    _diff.tolerance = tolerance
+    _diff.max_vertical_offset = _offset.max(axis=1, initial=0)
+    _diff.area_difference = _get_areas(other_points) - _get_areas(base_points)
+    if base_points.shape == other_points.shape:
+        _diff.changed_points = (np.abs(other_points - base_points) > tolerance).any(
+            axis=2
+        )
+    return _diff
+
+
+def diff_profile_collections(
+    base: DikeProfileCollection,
+    other: DikeProfileCollection,
+    base_ids: Optional[np.ndarray] = None,
+    other_ids: Optional[np.ndarray] = None,
+    tolerance: float = 0.0,
+) -> DikeProfileDiff:
+    """
+    Aligns two `DikeProfileCollection` by their section ids (or chainages) and compares the sections present in both.
+
+    Args:
+        base (DikeProfileCollection): Reference profiles.
+        other (DikeProfileCollection): Profiles to compare against the reference.
+        base_ids (Optional[np.ndarray], optional): Unique id of each profile in `base`. Defaults to their position.
+        other_ids (Optional[np.ndarray], optional): Unique id of each profile in `other`. Defaults to their position.
+        tolerance (float, optional): Coordinate differences up to this value are not considered a change. Defaults to 0.0.
+
+    Returns:
+        DikeProfileDiff: Per section differences, sorted by section id.
+    """
+    if base_ids is None:
+        base_ids = np.arange(len(base))
+    if other_ids is None:
+        other_ids = np.arange(len(other))
+
+    _ids, _base_idx, _other_idx = np.intersect1d(
+        base_ids, other_ids, assume_unique=True, return_indices=True
+    )
+    _diff = diff_characteristic_points(
+        base.geometries[base.geometry_indices[_base_idx]],
+        other.geometries[other.geometry_indices[_other_idx]],
+        _ids,
+        tolerance,
+    )
+    _set_unmatched_sections(_diff, base_ids, other_ids)
+    return _diff
+
+
+def _set_unmatched_sections(
+    diff: DikeProfileDiff, base_ids: np.ndarray, other_ids: np.ndarray
+) -> None:
+    diff.only_in_base = np.setdiff1d(base_ids, diff.section_ids, assume_unique=True)
+    diff.only_in_other = np.setdiff1d(other_ids, diff.section_ids, assume_unique=True)
+
+
+def _iter_sections(
+    files: List[Path], chunk_size: int, n_sections: int
+) -> Iterator[np.ndarray]:
+    # Memory-maps each file and yields the first `n_sections` in chunks of `chunk_size`.
+    _buffer = []
+    _n_buffered = 0
+    _n_remaining = n_sections
+    for _file in files:
+        _points = np.load(_file, mmap_mode="r")
+        _start = 0
+        while _start < len(_points) and _n_remaining:
+            _end = min(_start + chunk_size - _n_buffered, len(_points))
+            _end = min(_end, _start + _n_remaining)
+            _buffer.append(_points[_start:_end])
+            _n_buffered += _end - _start
+            _n_remaining -= _end - _start
+            _start = _end
+            if _n_buffered == chunk_size:
+                yield np.concatenate(_buffer)
+                _buffer = []
+                _n_buffered = 0
+    if _buffer:
+        yield np.concatenate(_buffer)
+
+
+def _iter_id_sections(
+    files: List[Path], id_files: Optional[List[Path]], chunk_size: int
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    # Yields the section ids (their position when no `id_files`) and points in chunks.
+    _n_sections = sum(len(np.load(_file, mmap_mode="r")) for _file in files)
+    if id_files is None:
+        _id_chunks = (
+            np.arange(_start, min(_start + chunk_size, _n_sections))
+            for _start in range(0, _n_sections, chunk_size)
+        )
+    else:
+        _n_ids = sum(len(np.load(_file, mmap_mode="r")) for _file in id_files)
+        if _n_ids != _n_sections:
+            raise ValueError(
+                "Expected as many section ids as sections, {} and {} provided".format(
+                    _n_ids, _n_sections
+                )
+            )
+        _id_chunks = _iter_sections(id_files, chunk_size, _n_sections)
+
+    _last_id = None
+    for _ids, _points in zip(
+        _id_chunks, _iter_sections(files, chunk_size, _n_sections)
+    ):
+        if (_last_id is not None and _ids[0] <= _last_id) or (np.diff(_ids) <= 0).any():
+            raise ValueError("Section ids should be unique and sorted ascending.")
+        _last_id = _ids[-1]
+        yield _ids, _points
+
+
+def iter_diff_profile_files(
+    base_files: List[Path],
+    other_files: List[Path],
+    chunk_size: int = 10000,
+    tolerance: float = 0.0,
+    base_id_files: Optional[List[Path]] = None,
+    other_id_files: Optional[List[Path]] = None,
+) -> Iterator[DikeProfileDiff]:
+    """
+    Streams the comparison of two sets of `.npy` files with characteristic points (as exported by `workflows.export_dike_profiles`).
+
+    The files are memory-mapped and read `chunk_size` sections at a time, so neither set is fully loaded. Sections are aligned by their id (or chainage) when id files are given, otherwise by their position across the files. As the ids of both sets are sorted, the chunks are merge-joined: each step compares the sections up to the smallest last id of the current chunks, so an inserted or removed section does not shift the ones after it.
+
+    Args:
+        base_files (List[Path]): Files with the reference profiles, in section order.
+        other_files (List[Path]): Files with the profiles to compare, in section order.
+        chunk_size (int, optional): Amount of sections read at once from each set. Defaults to 10000.
+        tolerance (float, optional): Coordinate differences up to this value are not considered a change. Defaults to 0.0.
+        base_id_files (Optional[List[Path]], optional): Files with the (unique, ascending) id of each section in `base_files`. Defaults to None, using their position.
+        other_id_files (Optional[List[Path]], optional): Files with the (unique, ascending) id of each section in `other_files`. Defaults to None, using their position.
+
+    Raises:
+        ValueError: When `chunk_size` is not greater than 0, or when the section ids do not match the sections or are not unique and sorted.
+
+    Yields:
+        DikeProfileDiff: Differences of each step, with the sections present in only one of the sets in `only_in_base` or `only_in_other`.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size should be greater than 0, {chunk_size} given.")
+
+    _base_chunks = _iter_id_sections(base_files, base_id_files, chunk_size)
+    _other_chunks = _iter_id_sections(other_files, other_id_files, chunk_size)
+    _base_ids, _base_points = next(_base_chunks, (None, None))
+    _other_ids, _other_points = next(_other_chunks, (None, None))
+    while _base_ids is not None and _other_ids is not None:
+        # Sections beyond the smallest last id may still match a later chunk.
+        _last_id = min(_base_ids[-1], _other_ids[-1])
+        _n_base = np.searchsorted(_base_ids, _last_id, side="right")
+        _n_other = np.searchsorted(_other_ids, _last_id, side="right")
+        _ids, _base_idx, _other_idx = np.intersect1d(
+            _base_ids[:_n_base],
+            _other_ids[:_n_other],
+            assume_unique=True,
+            return_indices=True,
+        )
+        _diff = diff_characteristic_points(
+            _base_points[_base_idx], _other_points[_other_idx], _ids, tolerance
+        )
+        _set_unmatched_sections(_diff, _base_ids[:_n_base], _other_ids[:_n_other])
+        yield _diff
+
+        _base_ids, _base_points = _base_ids[_n_base:], _base_points[_n_base:]
+        if not len(_base_ids):
+            _base_ids, _base_points = next(_base_chunks, (None, None))
+        _other_ids, _other_points = _other_ids[_n_other:], _other_points[_n_other:]
+        if not len(_other_ids):
+            _other_ids, _other_points = next(_other_chunks, (None, None))
+
+    # One of the sets is exhausted, the remaining sections of the other are unmatched.
+    while _base_ids is not None:
+        _diff = DikeProfileDiff()
+        _diff.only_in_base = _base_ids
+        yield _diff
+        _base_ids, _base_points = next(_base_chunks, (None, None))
+    while _other_ids is not None:
+        _diff = DikeProfileDiff()
+        _diff.only_in_other = _other_ids
+        yield _diff
+        _other_ids, _other_points = next(_other_chunks, (None, None))
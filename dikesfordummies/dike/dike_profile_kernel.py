@@ -0,0 +1,284 @@
+"""
+Compiled kernels computing the characteristic points of many dike profiles at once.
+
+The arithmetic mirrors `DikeProfileBuilder._build_waterside` and
+`DikeProfileBuilder._build_polderside` operation by operation, so the results are
+exactly equal to building each profile separately. When `numba` is installed the
+kernel is compiled and run in parallel across cores, otherwise a pure NumPy
+implementation is used. Both backends write straight into a preallocated output
+buffer of shape `(n_profiles, 8, 2)`.
+
+Dikes with several berms per side are computed with
+`build_berms_characteristic_points`, which generalizes the same arithmetic.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on the environment.
+    njit = None
+    prange = range
+
+N_INPUT_VALUES = 10
+N_CHARACTERISTIC_POINTS = 8
+
+
+def _fill_profiles(values: np.ndarray, out: np.ndarray) -> None:
+    # Column order matches `DikeInput.__dict__`.
+    for idx in prange(values.shape[0]):
+        _buiten_maaiveld = values[idx, 0]
+        _buiten_talud = values[idx, 1]
+        _buiten_berm_hoogte = values[idx, 2]
+        _buiten_berm_breedte = values[idx, 3]
+        _kruin_hoogte = values[idx, 4]
+        _kruin_breedte = values[idx, 5]
+        _binnen_talud = values[idx, 6]
+        _binnen_berm_hoogte = values[idx, 7]
+        _binnen_berm_breedte = values[idx, 8]
+        _binnen_maaiveld = values[idx, 9]
+
+        # Waterside
+        _p4_x = 0.0
+        _p3_x = _p4_x - ((_kruin_hoogte - _buiten_berm_hoogte) * _buiten_talud)
+        _p2_x = _p3_x - _buiten_berm_breedte
+        _p1_x = _p2_x - ((_buiten_berm_hoogte - _buiten_maaiveld) * _buiten_talud)
+
+        # Polderside
+        _p5_x = _kruin_breedte
+        _p6_x = _p5_x + ((_kruin_hoogte - _binnen_berm_hoogte) * _binnen_talud)
+        _p7_x = _p6_x + _binnen_berm_breedte
+        _p8_x = _p7_x + ((_binnen_berm_hoogte - _binnen_maaiveld) * _binnen_talud)
+
+        out[idx, 0, 0] = _p1_x
+        out[idx, 0, 1] = _buiten_maaiveld
+        out[idx, 1, 0] = _p2_x
+        out[idx, 1, 1] = _buiten_berm_hoogte
+        out[idx, 2, 0] = _p3_x
+        out[idx, 2, 1] = _buiten_berm_hoogte
+        out[idx, 3, 0] = _p4_x
+        out[idx, 3, 1] = _kruin_hoogte
+        out[idx, 4, 0] = _p5_x
+        out[idx, 4, 1] = _kruin_hoogte
+        out[idx, 5, 0] = _p6_x
+        out[idx, 5, 1] = _binnen_berm_hoogte
+        out[idx, 6, 0] = _p7_x
+        out[idx, 6, 1] = _binnen_berm_hoogte
+        out[idx, 7, 0] = _p8_x
+        out[idx, 7, 1] = _binnen_maaiveld
+
+
+def _fill_profiles_numpy(values: np.ndarray, out: np.ndarray) -> None:
+    # Every operation writes into a view of `out`, no intermediate arrays are created.
+    (
+        _buiten_maaiveld,
+        _buiten_talud,
+        _buiten_berm_hoogte,
+        _buiten_berm_breedte,
+        _kruin_hoogte,
+        _kruin_breedte,
+        _binnen_talud,
+        _binnen_berm_hoogte,
+        _binnen_berm_breedte,
+        _binnen_maaiveld,
+    ) = values.T
+    _x = out[:, :, 0]
+    _y = out[:, :, 1]
+
+    # Waterside
+    _x[:, 3] = 0.0
+    np.subtract(_kruin_hoogte, _buiten_berm_hoogte, out=_x[:, 2])
+    np.multiply(_x[:, 2], _buiten_talud, out=_x[:, 2])
+    np.subtract(_x[:, 3], _x[:, 2], out=_x[:, 2])
+    np.subtract(_x[:, 2], _buiten_berm_breedte, out=_x[:, 1])
+    np.subtract(_buiten_berm_hoogte, _buiten_maaiveld, out=_x[:, 0])
+    np.multiply(_x[:, 0], _buiten_talud, out=_x[:, 0])
+    np.subtract(_x[:, 1], _x[:, 0], out=_x[:, 0])
+
+    # Polderside
+    _x[:, 4] = _kruin_breedte
+    np.subtract(_kruin_hoogte, _binnen_berm_hoogte, out=_x[:, 5])
+    np.multiply(_x[:, 5], _binnen_talud, out=_x[:, 5])
+    np.add(_x[:, 4], _x[:, 5], out=_x[:, 5])
+    np.add(_x[:, 5], _binnen_berm_breedte, out=_x[:, 6])
+    np.subtract(_binnen_berm_hoogte, _binnen_maaiveld, out=_x[:, 7])
+    np.multiply(_x[:, 7], _binnen_talud, out=_x[:, 7])
+    np.add(_x[:, 6], _x[:, 7], out=_x[:, 7])
+
+    _y[:, 0] = _buiten_maaiveld
+    _y[:, 1] = _buiten_berm_hoogte
+    _y[:, 2] = _buiten_berm_hoogte
+    _y[:, 3] = _kruin_hoogte
+    _y[:, 4] = _kruin_hoogte
+    _y[:, 5] = _binnen_berm_hoogte
+    _y[:, 6] = _binnen_berm_hoogte
+    _y[:, 7] = _binnen_maaiveld
+
+
+_backends = dict(numpy=_fill_profiles_numpy)
+if njit is not None:
+    _backends["numba"] = njit(parallel=True, cache=True)(_fill_profiles)
+
+
+def available_backends() -> List[str]:
+    """
+    Names of the kernel backends that can be used in the current environment.
+
+    Returns:
+        List[str]: Available backends, the preferred one first.
+    """
+    return sorted(_backends.keys(), key=lambda x: x != "numba")
+
+
+def build_characteristic_points(
+    values: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    backend: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Computes the characteristic points of as many dike profiles as rows are given in `values`.
+
+    Args:
+        values (np.ndarray): Array of shape `(n, 10)` where each row represents a `DikeInput`.
+        out (Optional[np.ndarray], optional): Preallocated `float64` buffer of shape `(n, 8, 2)`. Defaults to None.
+        backend (Optional[str], optional): Name of the backend to use (see `available_backends`). Defaults to the preferred one.
+
+    Raises:
+        ValueError: When the `values` or `out` shapes are not valid, or the `backend` is not available.
+
+    Returns:
+        np.ndarray: Array of shape `(n, 8, 2)` with the `(x, y)` coordinates of each characteristic point.
+    """
+    if not backend:
+        backend = available_backends()[0]
+    if backend not in _backends:
+        raise ValueError(
+            "Backend '{}' not available, expected one of: {}".format(
+                backend, ", ".join(available_backends())
+            )
+        )
+
+    _values = np.ascontiguousarray(values, dtype=np.float64)
+    if _values.ndim != 2 or _values.shape[1] != N_INPUT_VALUES:
+        raise ValueError(
+            "Expected values of shape (n, {}), {} provided".format(
+                N_INPUT_VALUES, _values.shape
+            )
+        )
+
+    _expected_shape = (_values.shape[0], N_CHARACTERISTIC_POINTS, 2)
+    if out is None:
+        out = np.empty(_expected_shape, dtype=np.float64)
+    elif out.shape != _expected_shape or out.dtype != np.float64:
+        raise ValueError(
+            "Expected out buffer of shape {} and dtype float64, {} {} provided".format(
+                _expected_shape, out.shape, out.dtype
+            )
+        )
+
+    _backends[backend](_values, out)
+    return out
+
+
+def _fill_berms_profiles_numpy(
+    values: np.ndarray, n_berms: int, out: np.ndarray
+) -> None:
+    _x = out[:, :, 0]
+    _y = out[:, :, 1]
+    _kruin_idx = 2 + 2 * n_berms
+    _buiten_maaiveld = values[:, 0]
+    _buiten_talud = values[:, 1]
+    _kruin_hoogte = values[:, _kruin_idx]
+    _kruin_breedte = values[:, _kruin_idx + 1]
+    _binnen_talud = values[:, _kruin_idx + 2]
+    _binnen_maaiveld = values[:, -1]
+
+    # Waterside, from the crest outwards (berms are given from the toe upwards).
+    _prev = 2 * n_berms + 1
+    _x[:, _prev] = 0.0
+    _y[:, _prev] = _kruin_hoogte
+    for _berm in reversed(range(n_berms)):
+        _berm_hoogte = values[:, 2 + 2 * _berm]
+        _berm_breedte = values[:, 3 + 2 * _berm]
+        np.subtract(_y[:, _prev], _berm_hoogte, out=_x[:, _prev - 1])
+        np.multiply(_x[:, _prev - 1], _buiten_talud, out=_x[:, _prev - 1])
+        np.subtract(_x[:, _prev], _x[:, _prev - 1], out=_x[:, _prev - 1])
+        np.subtract(_x[:, _prev - 1], _berm_breedte, out=_x[:, _prev - 2])
+        _y[:, _prev - 1] = _berm_hoogte
+        _y[:, _prev - 2] = _berm_hoogte
+        _prev -= 2
+    np.subtract(_y[:, _prev], _buiten_maaiveld, out=_x[:, 0])
+    np.multiply(_x[:, 0], _buiten_talud, out=_x[:, 0])
+    np.subtract(_x[:, _prev], _x[:, 0], out=_x[:, 0])
+    _y[:, 0] = _buiten_maaiveld
+
+    # Polderside, from the crest outwards (berms are given from the crest downwards).
+    _prev = 2 * n_berms + 2
+    _x[:, _prev] = _kruin_breedte
+    _y[:, _prev] = _kruin_hoogte
+    for _berm in range(n_berms):
+        _berm_hoogte = values[:, _kruin_idx + 3 + 2 * _berm]
+        _berm_breedte = values[:, _kruin_idx + 4 + 2 * _berm]
+        np.subtract(_y[:, _prev], _berm_hoogte, out=_x[:, _prev + 1])
+        np.multiply(_x[:, _prev + 1], _binnen_talud, out=_x[:, _prev + 1])
+        np.add(_x[:, _prev], _x[:, _prev + 1], out=_x[:, _prev + 1])
+        np.add(_x[:, _prev + 1], _berm_breedte, out=_x[:, _prev + 2])
+        _y[:, _prev + 1] = _berm_hoogte
+        _y[:, _prev + 2] = _berm_hoogte
+        _prev += 2
+    np.subtract(_y[:, _prev], _binnen_maaiveld, out=_x[:, -1])
+    np.multiply(_x[:, -1], _binnen_talud, out=_x[:, -1])
+    np.add(_x[:, _prev], _x[:, -1], out=_x[:, -1])
+    _y[:, -1] = _binnen_maaiveld
+
+
+def build_berms_characteristic_points(
+    values: np.ndarray, n_berms: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Computes the characteristic points of dike profiles with `n_berms` berms on each side.
+
+    Each row of `values` follows the standard `DikeInput` order with the berm height and
+    width pairs repeated `n_berms` times. Waterside berms are given from the toe
+    upwards and polderside berms from the crest downwards, so that the values always
+    read from left to right along the profile. With `n_berms=1` the result is equal
+    to `build_characteristic_points`.
+
+    Args:
+        values (np.ndarray): Array of shape `(n, 6 + 4 * n_berms)`.
+        n_berms (int): Amount of berms on each side of the dike.
+        out (Optional[np.ndarray], optional): Preallocated `float64` buffer of shape `(n, 4 + 4 * n_berms, 2)`. Defaults to None.
+
+    Raises:
+        ValueError: When `n_berms` is lower than 1 or the `values` or `out` shapes are not valid.
+
+    Returns:
+        np.ndarray: Array of shape `(n, 4 + 4 * n_berms, 2)` with the `(x, y)` coordinates of each characteristic point.
+    """
+    if n_berms < 1:
+        raise ValueError("At least one berm is required, {} given".format(n_berms))
+
+    _n_values = 6 + 4 * n_berms
+    _values = np.ascontiguousarray(values, dtype=np.float64)
+    if _values.ndim != 2 or _values.shape[1] != _n_values:
+        raise ValueError(
+            "Expected values of shape (n, {}), {} provided".format(
+                _n_values, _values.shape
+            )
+        )
+
+    _expected_shape = (_values.shape[0], 4 + 4 * n_berms, 2)
+    if out is None:
+        out = np.empty(_expected_shape, dtype=np.float64)
+    elif out.shape != _expected_shape or out.dtype != np.float64:
+        raise ValueError(
+            "Expected out buffer of shape {} and dtype float64, {} {} provided".format(
+                _expected_shape, out.shape, out.dtype
+            )
+        )
+
+    _fill_berms_profiles_numpy(_values, n_berms, out)
+    return out
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Dict, List, Type
+
+import numpy as np
+
+from dikesfordummies.dike.dike_input import DikeInput
+from dikesfordummies.dike.dike_input_deduplication import deduplicate_inputs
+from dikesfordummies.dike.dike_profile import DikeProfile
+from dikesfordummies.dike.dike_profile_collection import DikeProfileCollection
+from dikesfordummies.dike.dike_profile_kernel import (
+    build_berms_characteristic_points,
+    build_characteristic_points,
+)
+from dikesfordummies.dike.dike_reinforcement_profile import DikeReinforcementProfile
+
+
+class DikeProfileType:
+    """
+    Description of a kind of dike profile: which input values it expects, how to compute its characteristic points for many profiles at once and which concrete `DikeProfileProtocol` represents a single profile.
+    """
+
+    name: str
+    input_keys: List[str]
+    default_input: List[float]
+    kernel: Callable[[np.ndarray], np.ndarray]
+    profile_class: Type[DikeProfile]
+
+    def __init__(
+        self,
+        name: str,
+        input_keys: List[str],
+        default_input: List[float],
+        kernel: Callable[[np.ndarray], np.ndarray],
+        profile_class: Type[DikeProfile],
+    ) -> None:
+        if len(input_keys) != len(default_input):
+            raise ValueError(
+                "Expected {} default values, {} provided".format(
+                    len(input_keys), len(default_input)
+                )
+            )
+        self.name = name
+        self.input_keys = input_keys
+        self.default_input = default_input
+        self.kernel = kernel
+        self.profile_class = profile_class
+
+    def build(
+        self, values: np.ndarray, deduplicate: bool = False, tolerance: float = 0.0
+    ) -> DikeProfileCollection:
+        """
+        Builds all the profiles represented by the rows in `values` with a single call to the type's kernel.
+
+        Args:
+            values (np.ndarray): Array of shape `(n, len(input_keys))`, a `List[List[float]]` is also accepted.
+            deduplicate (bool, optional): Whether to build each distinct input row only once. Defaults to False.
+            tolerance (float, optional): Quantization step under which two input rows are considered equal when deduplicating. Defaults to 0.0 (exact matches).
+
+        Returns:
+            DikeProfileCollection: Collection with the characteristic points of each profile.
+        """
+        if not deduplicate:
+            return DikeProfileCollection(self, self.kernel(values))
+        _unique_values, _geometry_indices = deduplicate_inputs(values, tolerance)
+        return DikeProfileCollection(
+            self, self.kernel(_unique_values), _geometry_indices
+        )
+
+
+_registry: Dict[str, DikeProfileType] = {}
+
+
+def register_profile_type(profile_type: DikeProfileType) -> None:
+    """
+    Registers a `DikeProfileType` so it can be retrieved by its name.
+
+    Args:
+        profile_type (DikeProfileType): Profile type to register.
+
+    Raises:
+        ValueError: When a profile type with the same name was already registered.
+    """
+    if profile_type.name in _registry:
+        raise ValueError(
+            "Profile type '{}' is already registered.".format(profile_type.name)
+        )
+    _registry[profile_type.name] = profile_type
+
+
+def get_profile_type(name: str) -> DikeProfileType:
+    """
+    Gets a registered `DikeProfileType` by its name.
+
+    Args:
+        name (str): Name of the profile type.
+
+    Raises:
+        ValueError: When no profile type is registered with the given name.
+
+    Returns:
+        DikeProfileType: Registered profile type.
+    """
+    if name not in _registry:
+        raise ValueError(
+            "Profile type '{}' not registered, expected one of: {}".format(
+                name, ", ".join(registered_profile_types())
+            )
+        )
+    return _registry[name]
+
+
+def registered_profile_types() -> List[str]:
+    """
+    Names of all the registered profile types.
+
+    Returns:
+        List[str]: Names in registration order.
+    """
+    return list(_registry.keys())
+
+
+def _get_berms_input_keys(n_berms: int) -> List[str]:
+    _keys = ["buiten_maaiveld", "buiten_talud"]
+    for _berm in range(1, n_berms + 1):
+        _keys.extend([f"buiten_berm_hoogte_{_berm}", f"buiten_berm_breedte_{_berm}"])
+    _keys.extend(["kruin_hoogte", "kruin_breedte", "binnen_talud"])
+    for _berm in range(1, n_berms + 1):
+        _keys.extend([f"binnen_berm_hoogte_{_berm}", f"binnen_berm_breedte_{_berm}"])
+    _keys.append("binnen_maaiveld")
+    return _keys
+
+
+def _get_berms_default_input(n_berms: int) -> List[float]:
+    # Evenly spaced berms of 2 meters wide between the ground level and the crest.
+    _kruin_hoogte = 2.0 * (n_berms + 1)
+    _berm_hoogtes = [2.0 * _berm for _berm in range(1, n_berms + 1)]
+    _values = [0.0, 3.0]
+    for _berm_hoogte in _berm_hoogtes:
+        _values.extend([_berm_hoogte, 2.0])
+    _values.extend([_kruin_hoogte, 5.0, 3.0])
+    for _berm_hoogte in reversed(_berm_hoogtes):
+        _values.extend([_berm_hoogte, 2.0])
+    _values.append(0.0)
+    return _values
+
+
+_dike_input_keys = list(DikeInput().__dict__.keys())
+_dike_default_input = [0, 3, 0, 0, 6, 5, 3, 0, 0, 0]
+
+register_profile_type(
+    DikeProfileType(
+        "dike",
+        _dike_input_keys,
+        _dike_default_input,
+        build_characteristic_points,
+        DikeProfile,
+    )
+)
+register_profile_type(
+    DikeProfileType(
+        "reinforced_dike",
+        _dike_input_keys,
+        _dike_default_input,
+        build_characteristic_points,
+        DikeReinforcementProfile,
+    )
+)
+for _n_berms in (2, 3):
+    register_profile_type(
+        DikeProfileType(
+            f"dike_{_n_berms}_berms",
+            _get_berms_input_keys(_n_berms),
+            _get_berms_default_input(_n_berms),
+            partial(build_berms_characteristic_points, n_berms=_n_berms),
+            DikeProfile,
+        )
+    )
@@ -1,8 +1,11 @@
 from matplotlib import pyplot
 from shapely.geometry import LineString
 
+from dikesfordummies.dike.dike_profile_collection import DikeProfileCollection
 from dikesfordummies.dike.dike_profile_protocol import DikeProfileProtocol
 
+_profile_color = "#03a9fc"
+
 
 def _plot_line(ax, ob, color):
     parts = hasattr(ob, "geoms") and ob or [ob]
@@ -24,6 +27,30 @@ def plot_profile(dike_profile: DikeProfileProtocol) -> pyplot:
     fig = pyplot.figure(1, dpi=90)
     _subplot = fig.add_subplot(221)
     _plot_line(
-        _subplot, LineString(dike_profile.characteristic_points), color="#03a9fc"
+        _subplot, LineString(dike_profile.characteristic_points), color=_profile_color
+    )
+    return fig
+
+
+def plot_profile_collection(dike_profiles: DikeProfileCollection) -> pyplot:
+    """
+    Plots all the profiles of a `DikeProfileCollection` with a single matplotlib call, without creating intermediate profile objects. Profiles sharing a geometry are only drawn once.
+
+    Args:
+        dike_profiles (DikeProfileCollection): Profiles to plot.
+
+    Returns:
+        pyplot: Plot containing a graphical interpretation of the Dikes' profile geometries.
+    """
+    fig = pyplot.figure(1, dpi=90)
+    _subplot = fig.add_subplot(221)
+    _points = dike_profiles.geometries
+    _subplot.plot(
+        _points[:, :, 0].T,
+        _points[:, :, 1].T,
+        color=_profile_color,
+        linewidth=3,
+        solid_capstyle="round",
+        zorder=1,
     )
     return fig
@@ -1,19 +1,84 @@
+import logging
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtGui, QtWidgets
 
-from dikesfordummies import workflows
 from dikesfordummies.gui import utils
 
 
+def _prefer_numba_omp_threading_layer() -> None:
+    # The TBB threading layer keeps the interpreter from exiting when it is first
+    # launched from a worker thread, as the render worker does. Only applies when
+    # not configured through the `NUMBA_THREADING_LAYER*` environment variables.
+    if any(
+        _env_var in os.environ
+        for _env_var in ["NUMBA_THREADING_LAYER", "NUMBA_THREADING_LAYER_PRIORITY"]
+    ):
+        return
+    try:
+        from numba import config as numba_config
+    except ImportError:
+        return
+    numba_config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+
+def _warm_up_render_worker() -> None:
+    # Heavy modules (numpy, shapely, matplotlib) are only imported here, in the
+    # render worker, so the window does not wait for them.
+    _prefer_numba_omp_threading_layer()
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib import pyplot
+
+    from dikesfordummies import workflows  # noqa: F401
+
+    # Drawing an empty figure initializes the backend and the font cache.
+    _figure = pyplot.figure()
+    _figure.canvas.draw()
+    pyplot.close(_figure)
+
+
+def _render_default_profile(outfile: Path) -> None:
+    from dikesfordummies import workflows
+
+    workflows.plot_dike_profile(list(workflows._default_input.values()), outfile)
+
+
+def _log_render_errors(future: Future) -> None:
+    if not future.cancelled() and future.exception():
+        logging.error("Rendering failed: %s", future.exception())
+
+
 class MainWindow(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super(MainWindow, self).__init__(parent)
         self.setWindowTitle("Dikes For Dummies")
+        self._output_dir: Optional[Path] = None
+        self._render_worker = ThreadPoolExecutor(max_workers=1)
+        self._warm_up_future: Optional[Future] = None
         self._set_menu_options()
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super(MainWindow, self).showEvent(event)
+        if self._warm_up_future is None:
+            # Deferred to the next event loop iteration so the window is painted first.
+            QtCore.QTimer.singleShot(0, self._warm_up)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._render_worker.shutdown(wait=False, cancel_futures=True)
+        super(MainWindow, self).closeEvent(event)
+
+    def _warm_up(self) -> None:
+        if self._warm_up_future is not None:
+            return
+        self._warm_up_future = self._render_worker.submit(_warm_up_render_worker)
+        self._warm_up_future.add_done_callback(_log_render_errors)
+
     def _set_menu_options(self) -> None:
         self._create_menu_button(
             50,
@@ -44,16 +109,23 @@ class MainWindow(QtWidgets.QWidget):
             self, dict(ax=50, ay=ay_pos, aw=160, az=30), title, tooltip, event, enabled
         )
 
-    def _plot_profile(self):
+    def _plot_profile(self) -> Optional[Future]:
         """
-        Runs the analysis
-        :return:
+        Renders the default profile in the output directory (requested first when not yet selected) without blocking the window.
+
+        Returns:
+            Optional[Future]: Pending render, None when no output directory was selected.
         """
-        # call DFS
-        _outfile = None
-        if self._output_dir:
-            _outfile = self._output_dir / "default_plot.png"
-        workflows.plot_dike_profile(list(workflows._default_input.values()), _outfile)
+        if not self._output_dir:
+            self._get_output_file()
+        if not self._output_dir:
+            return None
+        self._warm_up()
+        _render_future = self._render_worker.submit(
+            _render_default_profile, self._output_dir / "default_plot.png"
+        )
+        _render_future.add_done_callback(_log_render_errors)
+        return _render_future
 
 
 def main():
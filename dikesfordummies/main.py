@@ -1,12 +1,32 @@
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import click
+import numpy as np
 
 from dikesfordummies import workflows
+from dikesfordummies.dike.dike_profile_type import (
+    get_profile_type,
+    registered_profile_types,
+)
+from dikesfordummies.memory_profiler import (
+    MemoryProfiler,
+    profile_stage,
+    project_peak_memory,
+)
 
 _default_input = workflows._default_input
-_dike_keys = ", ".join(_default_input.keys())
+_profile_type_keys = "; ".join(
+    "{}: {}".format(_name, ", ".join(get_profile_type(_name).input_keys))
+    for _name in registered_profile_types()
+)
+
+_profile_memory_option = click.option(
+    "--profile_memory",
+    is_flag=True,
+    help="Track the memory allocations and report the peak memory and top allocation sites per stage.",
+)
 
 
 @click.group()
@@ -14,21 +34,222 @@ def cli():
     pass
 
 
-@cli.command(name="plot_profile")
+def _parse_dike_input(values: Tuple[str, ...]) -> Optional[List[float]]:
+    # Each token may hold one value or several comma separated ones.
+    _tokens = " ".join(values).replace(",", " ").split()
+    if not _tokens:
+        return None
+    try:
+        return [float(_token) for _token in _tokens]
+    except ValueError:
+        raise click.BadParameter(
+            "Expected numeric values, '{}' provided.".format(" ".join(values)),
+            param_hint="--dike_input",
+        )
+
+
+@cli.command(
+    name="plot_profile",
+    # Negative dike input values (e.g. `-1`) are not options.
+    context_settings=dict(ignore_unknown_options=True),
+)
 @click.option(
     "--dike_input",
-    nargs=10,
-    default=_default_input.values(),
-    type=float,
-    help=f"List of {len(_default_input.keys())} values for the dike input. Values represent {_dike_keys}.",
+    default=None,
+    help=f"Values for the dike input, space or comma separated, as many as input keys of the profile type, in the same order ({_profile_type_keys}). When not given the profile type's default values are used.",
+)
+@click.argument("dike_input_values", nargs=-1, type=click.UNPROCESSED)
+@click.option(
+    "--profile_type",
+    type=click.Choice(registered_profile_types()),
+    default="dike",
+    show_default=True,
+    help="Registered type of profile to plot.",
 )
 @click.option(
     "--outfile",
     type=click.Path(path_type=Path),
     help="The (optional) path where to save the profile plot.",
 )
-def plot_profile(dike_input: List[float], outfile: Optional[Path]):
-    workflows.plot_dike_profile(dike_input, outfile)
+@_profile_memory_option
+def plot_profile(
+    dike_input: Optional[str],
+    dike_input_values: Tuple[str, ...],
+    profile_type: str,
+    outfile: Optional[Path],
+    profile_memory: bool,
+):
+    # The values following the first one of `--dike_input` are collected as arguments.
+    dike_input = _parse_dike_input(
+        ((dike_input,) if dike_input else ()) + dike_input_values
+    )
+    _input_keys = get_profile_type(profile_type).input_keys
+    if not dike_input:
+        dike_input = get_profile_type(profile_type).default_input
+    elif len(dike_input) != len(_input_keys):
+        raise click.BadParameter(
+            "Profile type '{}' expects {} values ({}), {} provided.".format(
+                profile_type, len(_input_keys), ", ".join(_input_keys), len(dike_input)
+            ),
+            param_hint="--dike_input",
+        )
+    with MemoryProfiler() if profile_memory else nullcontext() as _profiler:
+        try:
+            workflows.plot_dike_profile(dike_input, outfile, profile_type, _profiler)
+        except ValueError as value_err:
+            raise click.BadParameter(str(value_err), param_hint="--dike_input")
+    if _profiler:
+        click.echo(_profiler.report())
+
+
+@cli.command(name="export_profiles")
+@click.option(
+    "--input_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="CSV file where each row contains the input values of a profile.",
+)
+@click.option(
+    "--output_dir",
+    required=True,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory where to export the profiles. Rerunning with the same directory resumes a previous export.",
+)
+@click.option(
+    "--profile_type",
+    type=click.Choice(registered_profile_types()),
+    default="dike",
+    show_default=True,
+    help="Registered type of the profiles to export.",
+)
+@click.option(
+    "--chunk_size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Maximum amount of profiles per exported file.",
+)
+@click.option(
+    "--deduplicate",
+    is_flag=True,
+    help="Build each distinct profile input only once.",
+)
+@click.option(
+    "--id_column",
+    is_flag=True,
+    help="The first column of each row is the section id (or chainage), sorted ascending. diff_profiles aligns sections by it instead of by position.",
+)
+@_profile_memory_option
+def export_profiles(
+    input_file: Path,
+    output_dir: Path,
+    profile_type: str,
+    chunk_size: int,
+    deduplicate: bool,
+    id_column: bool,
+    profile_memory: bool,
+):
+    with MemoryProfiler() if profile_memory else nullcontext() as _profiler:
+        with profile_stage(_profiler, "input_parsing"):
+            _dike_inputs = np.loadtxt(input_file, delimiter=",", ndmin=2)
+            _section_ids = None
+            if id_column:
+                _section_ids, _dike_inputs = _dike_inputs[:, 0], _dike_inputs[:, 1:]
+        try:
+            workflows.export_dike_profiles(
+                _dike_inputs,
+                output_dir,
+                profile_type,
+                chunk_size,
+                deduplicate,
+                _profiler,
+                _section_ids,
+            )
+        except ValueError as value_err:
+            raise click.ClickException(str(value_err))
+    if _profiler:
+        click.echo(_profiler.report())
+
+
+@cli.command(name="diff_profiles")
+@click.option(
+    "--base_dir",
+    required=True,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory with the reference profiles (as written by export_profiles).",
+)
+@click.option(
+    "--other_dir",
+    required=True,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory with the profiles to compare (as written by export_profiles).",
+)
+@click.option(
+    "--outfile",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="CSV file where to write the sections that differ.",
+)
+@click.option(
+    "--chunk_size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Amount of sections compared at once.",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Coordinate differences up to this value are not considered a change.",
+)
+def diff_profiles(
+    base_dir: Path, other_dir: Path, outfile: Path, chunk_size: int, tolerance: float
+):
+    try:
+        _n_reported = workflows.diff_dike_profile_exports(
+            base_dir, other_dir, outfile, chunk_size, tolerance
+        )
+    except ValueError as value_err:
+        raise click.ClickException(str(value_err))
+    click.echo(f"{_n_reported} differing sections written to {outfile}")
+
+
+@cli.command(name="estimate_memory")
+@click.option(
+    "--n_profiles",
+    required=True,
+    type=click.IntRange(min=1),
+    help="Amount of profiles to estimate the peak memory for.",
+)
+@click.option(
+    "--profile_type",
+    type=click.Choice(registered_profile_types()),
+    default="dike",
+    show_default=True,
+    help="Registered type of the profiles.",
+)
+@click.option(
+    "--calibration_size",
+    type=click.IntRange(min=2),
+    default=10000,
+    show_default=True,
+    help="Amount of profiles of the largest calibration run, a second run uses half of them.",
+)
+def estimate_memory(n_profiles: int, profile_type: str, calibration_size: int):
+    _profile_type = get_profile_type(profile_type)
+
+    def build_profiles(n_calibration: int) -> None:
+        _dike_inputs = np.tile(_profile_type.default_input, (n_calibration, 1))
+        _profile_type.build(_dike_inputs)
+
+    _peak_bytes = project_peak_memory(
+        build_profiles, n_profiles, [calibration_size // 2, calibration_size]
+    )
+    click.echo(
+        f"Projected peak memory for building {n_profiles} profiles: {_peak_bytes / 1024 ** 2:.1f} MiB"
+    )
 
 
 if __name__ == "__main__":
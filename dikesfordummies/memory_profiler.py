@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+
+def _format_bytes(n_bytes: float) -> str:
+    for _unit in ["B", "KiB", "MiB", "GiB"]:
+        if abs(n_bytes) < 1024 or _unit == "GiB":
+            return f"{n_bytes:.1f} {_unit}"
+        n_bytes /= 1024
+
+
+class StageMemoryReport:
+    """
+    Memory usage of a stage of a run. When a stage runs more than once (e.g. per chunk) the greatest peak is kept.
+    """
+
+    name: str
+    peak_bytes: int
+    allocated_bytes: int
+    top_sites: List[str]
+
+    def __init__(self) -> None:
+        self.name = ""
+        self.peak_bytes = 0
+        self.allocated_bytes = 0
+        self.top_sites = []
+
+    def __str__(self) -> str:
+        _lines = [
+            f"{self.name}: peak {_format_bytes(self.peak_bytes)}, retained {_format_bytes(self.allocated_bytes)}"
+        ]
+        _lines.extend(f"    {_site}" for _site in self.top_sites)
+        return "\n".join(_lines)
+
+
+class MemoryProfiler:
+    """
+    Opt-in allocation tracker based on `tracemalloc`. Use it as a context manager and wrap each stage of a run with `stage`.
+
+    Example:
+        >>> with MemoryProfiler() as _profiler:
+        ...     with _profiler.stage("profile_building"):
+        ...         ...
+        >>> print(_profiler.report())
+    """
+
+    top_sites: int
+    stages: Dict[str, StageMemoryReport]
+    peak_bytes: int
+
+    def __init__(self, top_sites: int = 5) -> None:
+        self.top_sites = top_sites
+        self.stages = {}
+        self.peak_bytes = 0
+        self._started_tracing = False
+        # Allocations of tracemalloc and of the profiler itself are not part of the
+        # profiled run. They are excluded by file name instead of with
+        # `Snapshot.filter_traces`, whose pattern matching allocates as well.
+        self._excluded_files = {tracemalloc.__file__, __file__}
+
+    def __enter__(self) -> MemoryProfiler:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        self._start_bytes = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._update_peak()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _update_peak(self) -> None:
+        # Should be called before taking any snapshot, so its memory is not counted.
+        self.peak_bytes = max(
+            self.peak_bytes, tracemalloc.get_traced_memory()[1] - self._start_bytes
+        )
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measures the peak memory and the top allocation sites of the wrapped code.
+
+        Args:
+            name (str): Name of the stage (e.g. `input_parsing`).
+
+        Raises:
+            ValueError: When the profiler is not tracing (not used as a context manager).
+        """
+        if not tracemalloc.is_tracing():
+            raise ValueError("MemoryProfiler should be used as a context manager.")
+        self._update_peak()
+        _before_snapshot_bytes = tracemalloc.get_traced_memory()[0]
+        _start_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        _start_bytes = tracemalloc.get_traced_memory()[0]
+        # The start snapshot is kept alive during the stage but is not part of the run.
+        _snapshot_bytes = _start_bytes - _before_snapshot_bytes
+        try:
+            yield
+        finally:
+            _current_bytes, _peak_bytes = tracemalloc.get_traced_memory()
+            self.peak_bytes = max(
+                self.peak_bytes, _peak_bytes - _snapshot_bytes - self._start_bytes
+            )
+            _end_snapshot = tracemalloc.take_snapshot()
+            _stats = [
+                _stat
+                for _stat in _end_snapshot.compare_to(_start_snapshot, "lineno")
+                if _stat.size_diff > 0
+                and _stat.traceback[0].filename not in self._excluded_files
+            ][: self.top_sites]
+            del _start_snapshot, _end_snapshot
+
+            _report = self.stages.setdefault(name, StageMemoryReport())
+            _report.name = name
+            if _peak_bytes - _start_bytes >= _report.peak_bytes:
+                _report.peak_bytes = _peak_bytes - _start_bytes
+                _report.allocated_bytes = _current_bytes - _start_bytes
+                _report.top_sites = [
+                    f"{_stat.traceback[0].filename}:{_stat.traceback[0].lineno}: {_format_bytes(_stat.size_diff)}"
+                    for _stat in _stats
+                ]
+            del _stats
+            # The snapshots are released, later peaks only measure the profiled run.
+            tracemalloc.reset_peak()
+
+    def report(self) -> str:
+        """
+        Human readable summary of the peak memory and the measured stages.
+
+        Returns:
+            str: Memory report.
+        """
+        _lines = [f"Peak memory: {_format_bytes(self.peak_bytes)}"]
+        _lines.extend(str(_stage) for _stage in self.stages.values())
+        return "\n".join(_lines)
+
+
+def profile_stage(
+    memory_profiler: Optional[MemoryProfiler], name: str
+) -> ContextManager:
+    """
+    Wraps a stage with `memory_profiler.stage` when a profiler is given, otherwise does nothing.
+
+    Args:
+        memory_profiler (Optional[MemoryProfiler]): Active profiler, if any.
+        name (str): Name of the stage.
+
+    Returns:
+        ContextManager: Context in which to run the stage.
+    """
+    if memory_profiler is None:
+        return nullcontext()
+    return memory_profiler.stage(name)
+
+
+def project_peak_memory(
+    run: Callable[[int], None],
+    n_target: int,
+    calibration_sizes: Optional[Sequence[int]] = None,
+) -> float:
+    """
+    Projects the peak memory needed by `run` for `n_target` items with a linear fit of the peaks measured for (small) calibration sizes.
+
+    Args:
+        run (Callable[[int], None]): Method processing the given amount of items.
+        n_target (int): Amount of items to project the peak memory for.
+        calibration_sizes (Optional[Sequence[int]], optional): At least two different amounts of items to measure. Defaults to 1000 and 2000.
+
+    Raises:
+        ValueError: When less than two different calibration sizes are given.
+
+    Returns:
+        float: Projected peak memory in bytes.
+    """
+    if not calibration_sizes:
+        calibration_sizes = [1000, 2000]
+    if len(set(calibration_sizes)) < 2:
+        raise ValueError("At least two different calibration sizes are required.")
+
+    # Warm up so one-off costs (imports, compilation, caches) are not projected.
+    run(min(calibration_sizes))
+    _peaks = []
+    for _size in calibration_sizes:
+        with MemoryProfiler() as _profiler:
+            run(_size)
+        _peaks.append(_profiler.peak_bytes)
+
+    _n = len(calibration_sizes)
+    _mean_size = sum(calibration_sizes) / _n
+    _mean_peak = sum(_peaks) / _n
+    _slope = sum(
+        (_size - _mean_size) * (_peak - _mean_peak)
+        for _size, _peak in zip(calibration_sizes, _peaks)
+    ) / sum((_size - _mean_size) ** 2 for _size in calibration_sizes)
+    return max(_mean_peak + _slope * (n_target - _mean_size), 0.0)
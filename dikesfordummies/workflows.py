@@ -1,40 +1,212 @@
+import hashlib
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from dikesfordummies import dike_plot
-from dikesfordummies.dike.dike_input import DikeInput
-from dikesfordummies.dike.dike_profile_builder import DikeProfileBuilder
+from dikesfordummies.batch_job import BatchJobManifest, atomic_write, run_chunked_job
+from dikesfordummies.dike.dike_profile_diff import iter_diff_profile_files
+from dikesfordummies.dike.dike_profile_type import get_profile_type
+from dikesfordummies.memory_profiler import MemoryProfiler, profile_stage
 
+_default_profile_type = get_profile_type("dike")
 _default_input = dict(
-    buiten_maaiveld=0,
-    buiten_talud=3,
-    buiten_berm_hoogte=0,
-    buiten_berm_breedte=0,
-    kruin_hoogte=6,
-    kruin_breedte=5,
-    binnen_talud=3,
-    binnen_berm_hoogte=0,
-    binnen_berm_breedte=0,
-    binnen_maaiveld=0,
+    zip(_default_profile_type.input_keys, _default_profile_type.default_input)
 )
 
 
-def plot_dike_profile(dike_input: List[float], outfile: Optional[Path]) -> None:
+def plot_dike_profile(
+    dike_input: List[float],
+    outfile: Optional[Path],
+    profile_type: str = "dike",
+    memory_profiler: Optional[MemoryProfiler] = None,
+) -> None:
     """
     Generates a `DikeProfile` plot with the reference data given in `dike_input`. The plot is either shown or saved depending on whether the argument `outfile` is given or not.
 
     Args:
         dike_input (List[float]): List of values representing a Dike's profile data.
         outfile (Optional[Path]): File path where to save the plot.
+        profile_type (str, optional): Name of a registered `DikeProfileType`. Defaults to "dike".
+        memory_profiler (Optional[MemoryProfiler], optional): Active profiler measuring each stage of the workflow. Defaults to None.
+
+    Raises:
+        ValueError: When the amount of values in `dike_input` does not match the profile type.
+    """
+    _profile_type = get_profile_type(profile_type)
+    with profile_stage(memory_profiler, "input_parsing"):
+        if not dike_input or len(dike_input) != len(_profile_type.input_keys):
+            raise ValueError(
+                "Expected {} values, {} provided".format(
+                    len(_profile_type.input_keys), len(dike_input or [])
+                )
+            )
+        _dike_inputs = np.array([dike_input], dtype=np.float64)
+    with profile_stage(memory_profiler, "profile_building"):
+        _profiles = _profile_type.build(_dike_inputs)
+    with profile_stage(memory_profiler, "plotting"):
+        _plot = dike_plot.plot_profile_collection(_profiles)
+        if not outfile:
+            _plot.show()
+            return
+        elif outfile.is_file():
+            outfile.unlink()
+        if not outfile.parent.exists():
+            outfile.parent.mkdir(parents=True)
+        _plot.savefig(outfile)
+
+
+def export_dike_profiles(
+    dike_inputs: np.ndarray,
+    output_dir: Path,
+    profile_type: str = "dike",
+    chunk_size: int = 10000,
+    deduplicate: bool = False,
+    memory_profiler: Optional[MemoryProfiler] = None,
+    section_ids: Optional[np.ndarray] = None,
+) -> List[Path]:
+    """
+    Builds the characteristic points of all the profiles in `dike_inputs` and exports them in chunks as `.npy` files (arrays of shape `(chunk_size, n_points, 2)`).
+
+    When `section_ids` are given, the ids of each chunk are exported as well (`ids_*.npy`), so `diff_dike_profile_exports` aligns the sections by id instead of by position.
+
+    The progress is recorded in a `manifest.json` in `output_dir`. Running the export again with the same arguments skips the chunks already exported, outputs are written atomically so an interrupted run never leaves partial files behind.
+
+    Args:
+        dike_inputs (np.ndarray): Array of shape `(n, n_values)` where each row represents a profile's input.
+        output_dir (Path): Directory where to export the profiles and the manifest.
+        profile_type (str, optional): Name of a registered `DikeProfileType`. Defaults to "dike".
+        chunk_size (int, optional): Maximum amount of profiles per exported file. Defaults to 10000.
+        deduplicate (bool, optional): Whether to build each distinct input only once per chunk. Defaults to False.
+        memory_profiler (Optional[MemoryProfiler], optional): Active profiler measuring each stage of the workflow. Defaults to None.
+        section_ids (Optional[np.ndarray], optional): Unique id (or chainage) of each profile, sorted ascending. Defaults to None.
+
+    Raises:
+        ValueError: When the existing manifest in `output_dir` belongs to a different export, or when `section_ids` do not match the inputs or are not unique and sorted.
+
+    Returns:
+        List[Path]: Exported files, sorted by their first profile.
     """
-    _dike_input = DikeInput.from_list(dike_input)
-    _dike = DikeProfileBuilder.from_input(_dike_input).build()
-    _plot = dike_plot.plot_profile(_dike)
-    if not outfile:
-        _plot.show()
-        return
-    elif outfile.is_file():
-        outfile.unlink()
-    if not outfile.parent.exists():
-        outfile.parent.mkdir(parents=True)
-    _plot.savefig(outfile)
+    _profile_type = get_profile_type(profile_type)
+    with profile_stage(memory_profiler, "input_parsing"):
+        _dike_inputs = np.ascontiguousarray(dike_inputs, dtype=np.float64)
+    _job_signature = dict(
+        workflow="export_dike_profiles",
+        profile_type=profile_type,
+        chunk_size=chunk_size,
+        n_inputs=len(_dike_inputs),
+        inputs_sha256=hashlib.sha256(_dike_inputs).hexdigest(),
+    )
+    if section_ids is not None:
+        section_ids = np.ascontiguousarray(section_ids)
+        if section_ids.shape != (len(_dike_inputs),):
+            raise ValueError(
+                "Expected one section id per input, {} provided for {} inputs".format(
+                    section_ids.shape, len(_dike_inputs)
+                )
+            )
+        if (np.diff(section_ids) <= 0).any():
+            raise ValueError("Section ids should be unique and sorted ascending.")
+        _job_signature["ids_sha256"] = hashlib.sha256(section_ids).hexdigest()
+    _manifest = BatchJobManifest.from_file(output_dir / "manifest.json", _job_signature)
+
+    def export_chunk(start: int, end: int) -> Tuple[Path, Dict[str, Path]]:
+        with profile_stage(memory_profiler, "profile_building"):
+            _profiles = _profile_type.build(_dike_inputs[start:end], deduplicate)
+        _outfile = output_dir / f"profiles_{start:09d}_{end:09d}.npy"
+        _extra_outputs = {}
+        with profile_stage(memory_profiler, "export"):
+            atomic_write(
+                _outfile,
+                lambda stream: np.save(stream, _profiles.characteristic_points),
+            )
+            if section_ids is not None:
+                _extra_outputs["ids"] = output_dir / f"ids_{start:09d}_{end:09d}.npy"
+                atomic_write(
+                    _extra_outputs["ids"],
+                    lambda stream: np.save(stream, section_ids[start:end]),
+                )
+        return _outfile, _extra_outputs
+
+    return run_chunked_job(len(_dike_inputs), chunk_size, _manifest, export_chunk)
+
+
+def _get_export_outputs(export_dir: Path) -> Tuple[List[Path], Optional[List[Path]]]:
+    # Only the chunks recorded in the manifest belong to the export, other
+    # `profiles_*.npy` files in the directory may be left from another job.
+    _manifest = BatchJobManifest.from_file(export_dir / "manifest.json")
+    if not _manifest.covers(_manifest.job_signature["n_inputs"]):
+        raise ValueError(
+            f"Export in {export_dir} is incomplete, resume it before comparing."
+        )
+    if "ids_sha256" not in _manifest.job_signature:
+        return _manifest.get_outputs(), None
+    return _manifest.get_outputs(), _manifest.get_outputs("ids")
+
+
+def diff_dike_profile_exports(
+    base_dir: Path,
+    other_dir: Path,
+    outfile: Path,
+    chunk_size: int = 10000,
+    tolerance: float = 0.0,
+) -> int:
+    """
+    Compares two directories of profiles exported with `export_dike_profiles` and writes a CSV report of the sections that differ.
+
+    The exports are streamed from disk `chunk_size` sections at a time and the report is written atomically. Sections are aligned by their id when both exports have section ids, otherwise by their position. Each row contains the `section` (its id, or its position in the export), its `status` (`changed`, `only_in_base` or `only_in_other`), the `max_vertical_offset` and the `area_difference` (other minus base).
+
+    Args:
+        base_dir (Path): Directory with the reference export.
+        other_dir (Path): Directory with the export to compare.
+        outfile (Path): CSV file where to write the report.
+        chunk_size (int, optional): Amount of sections compared at once. Defaults to 10000.
+        tolerance (float, optional): Coordinate differences up to this value are not considered a change. Defaults to 0.0.
+
+    Raises:
+        ValueError: When a directory has no export manifest, its export is incomplete, or only one of the exports has section ids.
+
+    Returns:
+        int: Amount of sections reported.
+    """
+    _base_files, _base_id_files = _get_export_outputs(base_dir)
+    _other_files, _other_id_files = _get_export_outputs(other_dir)
+    if (_base_id_files is None) != (_other_id_files is None):
+        _dir_with_ids = base_dir if _base_id_files is not None else other_dir
+        raise ValueError(
+            f"Only the export in {_dir_with_ids} has section ids, export both with or without them to compare."
+        )
+    _n_reported = 0
+
+    def write_report(stream) -> None:
+        nonlocal _n_reported
+        stream.write(b"section,status,max_vertical_offset,area_difference\n")
+        for _diff in iter_diff_profile_files(
+            _base_files,
+            _other_files,
+            chunk_size,
+            tolerance,
+            _base_id_files,
+            _other_id_files,
+        ):
+            _changed = _diff.changed
+            _lines = [
+                f"{_section},changed,{_offset},{_area}\n"
+                for _section, _offset, _area in zip(
+                    _diff.section_ids[_changed],
+                    _diff.max_vertical_offset[_changed],
+                    _diff.area_difference[_changed],
+                )
+            ]
+            _lines.extend(
+                f"{_section},only_in_base,,\n" for _section in _diff.only_in_base
+            )
+            _lines.extend(
+                f"{_section},only_in_other,,\n" for _section in _diff.only_in_other
+            )
+            stream.write("".join(_lines).encode())
+            _n_reported += len(_lines)
+
+    atomic_write(outfile, write_report)
+    return _n_reported
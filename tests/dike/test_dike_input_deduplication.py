@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from dikesfordummies.dike.dike_input_deduplication import deduplicate_inputs
+
+
+class TestDeduplicateInputs:
+    def test_given_repeated_rows_when_deduplicate_then_returns_unique_rows(self):
+        # 1. Define test data.
+        _values = np.array([[0, 1, 2], [3, 4, 5], [0, 1, 2], [3, 4, 5], [6, 7, 8]])
+
+        # 2. Run test.
+        _unique, _indices = deduplicate_inputs(_values)
+
+        # 3. Verify expectations.
+        assert len(_unique) == 3
+        assert np.array_equal(_unique[_indices], _values)
+
+    def test_given_signed_zeros_when_deduplicate_then_merges_rows(self):
+        _unique, _indices = deduplicate_inputs(np.array([[0.0, 1], [-0.0, 1]]))
+
+        assert len(_unique) == 1
+        assert _indices.tolist() == [0, 0]
+
+    def test_given_tolerance_when_deduplicate_then_groups_near_identical_rows(self):
+        # 1. Define test data.
+        _values = np.array([[0, 1.0001], [0, 0.9999], [0, 1.1]])
+
+        # 2. Run test.
+        _unique, _indices = deduplicate_inputs(_values, tolerance=0.01)
+
+        # 3. Verify expectations.
+        assert len(_unique) == 2
+        assert _indices[0] == _indices[1]
+        assert _indices[0] != _indices[2]
+
+    def test_given_negative_tolerance_when_deduplicate_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            deduplicate_inputs(np.zeros((2, 2)), tolerance=-1)
+        assert str(exc_err.value) == "Tolerance should be positive, -1 given"
+
+    @pytest.mark.parametrize(
+        "invalid_value",
+        [
+            pytest.param(np.nan, id="NaN"),
+            pytest.param(np.inf, id="Infinite"),
+            pytest.param(1e308, id="Out of range"),
+        ],
+    )
+    def test_given_non_finite_values_when_deduplicate_with_tolerance_then_raises(
+        self, invalid_value: float
+    ):
+        # 1. Define test data.
+        _values = np.array([[0, 1.0], [invalid_value, 2.0]])
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            deduplicate_inputs(_values, tolerance=1e-3)
+
+        # 3. Verify expectations.
+        assert str(exc_err.value).startswith("Values should be finite")
+
+    def test_given_large_values_when_deduplicate_with_tolerance_then_keeps_rows_apart(
+        self,
+    ):
+        # Quantized keys beyond the int64 range should not wrap around and collide.
+        _values = np.array([[1e16, 0.0], [-1e16, 0.0]])
+
+        _unique, _indices = deduplicate_inputs(_values, tolerance=1e-3)
+
+        assert len(_unique) == 2
+        assert sorted(_indices.tolist()) == [0, 1]
@@ -0,0 +1,49 @@
+import numpy as np
+
+from dikesfordummies.dike.dike_input import DikeInput
+from dikesfordummies.dike.dike_profile_builder import DikeProfileBuilder
+from dikesfordummies.dike.dike_profile_protocol import DikeProfileProtocol
+from dikesfordummies.dike.dike_profile_type import get_profile_type
+from dikesfordummies.dike.dike_reinforcement_profile import DikeReinforcementProfile
+
+
+class TestDikeProfileCollection:
+    def test_given_collection_when_getitem_then_equals_dike_profile_builder(self):
+        # 1. Define test data.
+        _values = [0, 3, 1, 2, 6, 5, 3, 1, 2, 0]
+        _expected = DikeProfileBuilder.from_input(
+            DikeInput.from_list(_values), DikeReinforcementProfile
+        ).build()
+
+        # 2. Run test.
+        _profiles = get_profile_type("reinforced_dike").build([_values])
+        _profile = _profiles[0]
+
+        # 3. Verify expectations.
+        assert isinstance(_profile, DikeReinforcementProfile)
+        assert isinstance(_profile, DikeProfileProtocol)
+        assert [(_p.x, _p.y) for _p in _profile.characteristic_points] == [
+            (_p.x, _p.y) for _p in _expected.characteristic_points
+        ]
+        assert _profiles.heights.tolist() == [_expected.height]
+        assert _profiles.widths.tolist() == [_expected.width]
+
+    def test_given_repeated_inputs_when_build_deduplicated_then_shares_geometries(
+        self,
+    ):
+        # 1. Define test data.
+        _values = [[0, 3, 1, 2, 6, 5, 3, 1, 2, 0], [0, 3, 0, 0, 6, 5, 3, 0, 0, 0]] * 50
+        _profile_type = get_profile_type("dike")
+
+        # 2. Run test.
+        _profiles = _profile_type.build(_values, deduplicate=True)
+
+        # 3. Verify expectations.
+        _expected = _profile_type.build(_values)
+        assert len(_profiles) == 100
+        assert len(_profiles.geometries) == 2
+        assert np.array_equal(
+            _profiles.characteristic_points, _expected.characteristic_points
+        )
+        assert np.array_equal(_profiles.heights, _expected.heights)
+        assert np.array_equal(_profiles.widths, _expected.widths)
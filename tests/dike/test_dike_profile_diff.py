@@ -0,0 +1,256 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from dikesfordummies import workflows
+from dikesfordummies.dike.dike_profile_diff import (
+    diff_characteristic_points,
+    diff_profile_collections,
+    iter_diff_profile_files,
+)
+from dikesfordummies.dike.dike_profile_type import get_profile_type
+from tests import test_results
+
+_default_input = get_profile_type("dike").default_input
+
+
+class TestDiffCharacteristicPoints:
+    def test_given_raised_crest_then_returns_offset_and_area(self):
+        # 1. Define test data.
+        _profile_type = get_profile_type("dike")
+        _raised_input = list(_default_input)
+        _raised_input[4] += 1
+        _base = _profile_type.build([_default_input, _default_input])
+        _other = _profile_type.build([_default_input, _raised_input])
+
+        # 2. Run test.
+        _diff = diff_characteristic_points(
+            _base.characteristic_points, _other.characteristic_points
+        )
+
+        # 3. Verify expectations.
+        assert _diff.section_ids.tolist() == [0, 1]
+        assert _diff.changed.tolist() == [False, True]
+        assert _diff.max_vertical_offset.tolist() == [0, 1]
+        # Trapezoid (5 m crest, 1:3 slopes) raised from 6 m (138 m2) to 7 m (182 m2).
+        assert _diff.area_difference.tolist() == [0, 44]
+        assert not _diff.changed_points[0].any()
+        assert _diff.changed_points[1].all()
+
+    def test_given_different_layouts_then_compares_geometry(self):
+        # 1. Define test data.
+        _base = get_profile_type("dike").build([_default_input])
+        _other = get_profile_type("dike_2_berms").build(
+            [[0, 3, 0, 0, 0, 0, 6, 5, 3, 0, 0, 0, 0, 0]]
+        )
+
+        # 2. Run test.
+        _diff = diff_characteristic_points(
+            _base.characteristic_points, _other.characteristic_points
+        )
+
+        # 3. Verify expectations.
+        assert _diff.changed_points is None
+        assert _diff.max_vertical_offset.tolist() == [0]
+        assert _diff.area_difference.tolist() == [0]
+        assert not _diff.changed.any()
+
+    @pytest.mark.parametrize(
+        "tolerance, expected",
+        [
+            pytest.param(0.0, [True], id="Exact"),
+            pytest.param(1e-6, [False], id="Within tolerance"),
+        ],
+    )
+    def test_given_different_layouts_with_noise_then_applies_tolerance(
+        self, tolerance: float, expected: list
+    ):
+        # 1. Define test data.
+        _base = get_profile_type("dike").build([_default_input])
+        _other = get_profile_type("dike_2_berms").build(
+            [[0, 3, 0, 0, 0, 0, 6 + 1e-9, 5, 3, 0, 0, 0, 0, 0]]
+        )
+
+        # 2. Run test.
+        _diff = diff_characteristic_points(
+            _base.characteristic_points,
+            _other.characteristic_points,
+            tolerance=tolerance,
+        )
+
+        # 3. Verify expectations.
+        assert _diff.changed_points is None
+        assert _diff.tolerance == tolerance
+        assert _diff.changed.tolist() == expected
+
+    @pytest.mark.parametrize(
+        "crest_raise, expected",
+        [
+            pytest.param(0.01, False, id="Within tolerance"),
+            pytest.param(0.1, True, id="Beyond tolerance"),
+        ],
+    )
+    def test_given_uniform_change_then_same_and_mixed_layouts_agree(
+        self, crest_raise: float, expected: bool
+    ):
+        # 1. Define test data.
+        _base_2_berms = [0, 3, 0, 0, 0, 0, 6, 5, 3, 0, 0, 0, 0, 0]
+        _base = get_profile_type("dike").build([_default_input])
+        _base_equivalent = get_profile_type("dike_2_berms").build([_base_2_berms])
+        _raised_input = list(_default_input)
+        _raised_input[4] += crest_raise
+        _other = get_profile_type("dike").build([_raised_input])
+
+        # 2. Run test.
+        _same_diff = diff_characteristic_points(
+            _base.characteristic_points, _other.characteristic_points, tolerance=0.05
+        )
+        _mixed_diff = diff_characteristic_points(
+            _base_equivalent.characteristic_points,
+            _other.characteristic_points,
+            tolerance=0.05,
+        )
+
+        # 3. Verify expectations.
+        assert _mixed_diff.changed_points is None
+        assert _same_diff.changed.tolist() == [expected]
+        assert _mixed_diff.changed.tolist() == [expected]
+        assert _mixed_diff.max_vertical_offset == pytest.approx([crest_raise])
+
+    def test_given_different_amount_of_sections_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            diff_characteristic_points(np.zeros((2, 8, 2)), np.zeros((3, 8, 2)))
+        assert str(exc_err.value) == (
+            "Expected the same amount of sections, 2 and 3 provided"
+        )
+
+
+class TestDiffProfileCollections:
+    def test_given_ids_then_aligns_sections(self):
+        # 1. Define test data.
+        _profile_type = get_profile_type("dike")
+        _base = _profile_type.build([_default_input] * 3, deduplicate=True)
+        _other = _profile_type.build([_default_input] * 3)
+
+        # 2. Run test.
+        _diff = diff_profile_collections(
+            _base, _other, np.array([10.0, 20.0, 30.0]), np.array([30.0, 40.0, 20.0])
+        )
+
+        # 3. Verify expectations.
+        assert _diff.section_ids.tolist() == [20.0, 30.0]
+        assert _diff.only_in_base.tolist() == [10.0]
+        assert _diff.only_in_other.tolist() == [40.0]
+        assert not _diff.changed.any()
+
+
+class TestIterDiffProfileFiles:
+    def test_given_exports_then_streams_chunks(self, request: pytest.FixtureRequest):
+        # 1. Define test data.
+        _test_dir = test_results / request.node.name
+        shutil.rmtree(_test_dir, ignore_errors=True)
+        _base_inputs = np.tile(_default_input, (25, 1)).astype(float)
+        _other_inputs = np.tile(_default_input, (27, 1)).astype(float)
+        _other_inputs[12, 4] += 1
+        _base_files = workflows.export_dike_profiles(
+            _base_inputs, _test_dir / "base", chunk_size=10
+        )
+        _other_files = workflows.export_dike_profiles(
+            _other_inputs, _test_dir / "other", chunk_size=7
+        )
+
+        # 2. Run test.
+        _diffs = list(iter_diff_profile_files(_base_files, _other_files, chunk_size=8))
+
+        # 3. Verify expectations.
+        assert [len(_diff) for _diff in _diffs] == [8, 8, 8, 1, 0]
+        _changed = np.concatenate([_d.section_ids[_d.changed] for _d in _diffs])
+        assert _changed.tolist() == [12]
+        assert _diffs[-1].only_in_other.tolist() == [25, 26]
+        assert not _diffs[-1].only_in_base.size
+
+    @staticmethod
+    def _save_chunks(test_dir, name: str, values: np.ndarray, chunk_size: int):
+        test_dir.mkdir(parents=True, exist_ok=True)
+        _files = []
+        for _start in range(0, len(values), chunk_size):
+            _files.append(test_dir / f"{name}_{_start}.npy")
+            np.save(_files[-1], values[_start : _start + chunk_size])
+        return _files
+
+    @pytest.mark.parametrize(
+        "chunk_sizes",
+        [
+            pytest.param((4, 4, 4), id="Same chunks"),
+            pytest.param((3, 7, 5), id="Different chunks"),
+            pytest.param((50, 50, 1), id="One section at a time"),
+        ],
+    )
+    def test_given_ids_then_aligns_streamed_sections_as_collections(
+        self, chunk_sizes: tuple, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        _test_dir = test_results / request.node.name
+        shutil.rmtree(_test_dir, ignore_errors=True)
+        _random = np.random.default_rng(42)
+        _profile_type = get_profile_type("dike")
+        _base_ids = np.sort(_random.choice(60, 30, replace=False)) * 10.0
+        _other_ids = np.sort(_random.choice(60, 35, replace=False)) * 10.0
+        _base_inputs = np.tile(_default_input, (30, 1)).astype(float)
+        _other_inputs = np.tile(_default_input, (35, 1)).astype(float)
+        _other_inputs[::4, 4] += 1
+        _base = _profile_type.build(_base_inputs)
+        _other = _profile_type.build(_other_inputs)
+        _base_size, _other_size, _chunk_size = chunk_sizes
+
+        # 2. Run test.
+        _diffs = list(
+            iter_diff_profile_files(
+                self._save_chunks(
+                    _test_dir, "base", _base.characteristic_points, _base_size
+                ),
+                self._save_chunks(
+                    _test_dir, "other", _other.characteristic_points, _other_size
+                ),
+                _chunk_size,
+                base_id_files=self._save_chunks(
+                    _test_dir, "base_ids", _base_ids, _base_size
+                ),
+                other_id_files=self._save_chunks(
+                    _test_dir, "other_ids", _other_ids, _other_size
+                ),
+            )
+        )
+
+        # 3. Verify expectations.
+        _expected = diff_profile_collections(_base, _other, _base_ids, _other_ids)
+        assert np.concatenate([_d.section_ids for _d in _diffs]).tolist() == (
+            _expected.section_ids.tolist()
+        )
+        assert np.concatenate([_d.changed for _d in _diffs]).tolist() == (
+            _expected.changed.tolist()
+        )
+        assert np.concatenate([_d.only_in_base for _d in _diffs]).tolist() == (
+            _expected.only_in_base.tolist()
+        )
+        assert np.concatenate([_d.only_in_other for _d in _diffs]).tolist() == (
+            _expected.only_in_other.tolist()
+        )
+
+    def test_given_unsorted_ids_then_raises(self, request: pytest.FixtureRequest):
+        # 1. Define test data.
+        _test_dir = test_results / request.node.name
+        shutil.rmtree(_test_dir, ignore_errors=True)
+        _points = get_profile_type("dike").build([_default_input] * 4)
+        _files = self._save_chunks(_test_dir, "p", _points.characteristic_points, 2)
+        _id_files = self._save_chunks(_test_dir, "i", np.array([0, 2, 1, 3]), 2)
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            list(iter_diff_profile_files(_files, _files, 2, 0.0, _id_files, _id_files))
+
+        # 3. Verify expectations.
+        assert (
+            str(exc_err.value) == "Section ids should be unique and sorted ascending."
+        )
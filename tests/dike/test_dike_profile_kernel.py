@@ -0,0 +1,123 @@
+import random
+
+import numpy as np
+import pytest
+
+from dikesfordummies.dike.dike_input import DikeInput
+from dikesfordummies.dike.dike_profile_builder import DikeProfileBuilder
+from dikesfordummies.dike.dike_profile_kernel import (
+    available_backends,
+    build_berms_characteristic_points,
+    build_characteristic_points,
+)
+
+
+def _get_random_inputs(n_inputs: int):
+    _random = random.Random(42)
+    return [[_random.uniform(-10, 10) for _ in range(10)] for _ in range(n_inputs)]
+
+
+class TestDikeProfileKernel:
+    def test_available_backends_contains_numpy(self):
+        assert "numpy" in available_backends()
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_given_inputs_when_build_then_equals_dike_profile_builder(
+        self, backend: str
+    ):
+        # 1. Define test data.
+        _inputs = _get_random_inputs(50)
+        _expected = [
+            [
+                (_p.x, _p.y)
+                for _p in DikeProfileBuilder.from_input(DikeInput.from_list(_values))
+                .build()
+                .characteristic_points
+            ]
+            for _values in _inputs
+        ]
+
+        # 2. Run test.
+        _points = build_characteristic_points(np.array(_inputs), backend=backend)
+
+        # 3. Verify expectations.
+        assert _points.shape == (50, 8, 2)
+        assert _points.tolist() == [list(map(list, _p)) for _p in _expected]
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_given_out_buffer_when_build_then_writes_into_it(self, backend: str):
+        # 1. Define test data.
+        _inputs = np.array(_get_random_inputs(5))
+        _out = np.zeros((5, 8, 2))
+
+        # 2. Run test.
+        _points = build_characteristic_points(_inputs, out=_out, backend=backend)
+
+        # 3. Verify expectations.
+        assert _points is _out
+        assert np.array_equal(_out, build_characteristic_points(_inputs))
+
+    def test_given_invalid_values_when_build_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            build_characteristic_points(np.zeros((3, 9)))
+        assert str(exc_err.value) == "Expected values of shape (n, 10), (3, 9) provided"
+
+    def test_given_invalid_out_when_build_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            build_characteristic_points(np.zeros((3, 10)), out=np.zeros((2, 8, 2)))
+        assert "Expected out buffer of shape (3, 8, 2)" in str(exc_err.value)
+
+    def test_given_unknown_backend_when_build_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            build_characteristic_points(np.zeros((1, 10)), backend="fortran")
+        assert str(exc_err.value).startswith("Backend 'fortran' not available")
+
+
+class TestDikeBermsProfileKernel:
+    def test_given_one_berm_when_build_then_equals_standard_kernel(self):
+        # 1. Define test data.
+        _inputs = np.array(_get_random_inputs(50))
+
+        # 2. Run test.
+        _points = build_berms_characteristic_points(_inputs, n_berms=1)
+
+        # 3. Verify expectations.
+        assert np.array_equal(
+            _points, build_characteristic_points(_inputs, backend="numpy")
+        )
+
+    def test_given_two_berms_when_build_then_returns_expected_points(self):
+        # 1. Define test data.
+        _input = [0, 2, 1, 1, 3, 2, 5, 4, 1, 4, 2, 2, 1, 0]
+        _expected = [
+            [-13, 0],
+            [-11, 1],
+            [-10, 1],
+            [-6, 3],
+            [-4, 3],
+            [0, 5],
+            [4, 5],
+            [5, 4],
+            [7, 4],
+            [9, 2],
+            [10, 2],
+            [12, 0],
+        ]
+
+        # 2. Run test.
+        _points = build_berms_characteristic_points([_input], n_berms=2)
+
+        # 3. Verify expectations.
+        assert _points.tolist() == [_expected]
+
+    def test_given_no_berms_when_build_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            build_berms_characteristic_points(np.zeros((1, 6)), n_berms=0)
+        assert str(exc_err.value) == "At least one berm is required, 0 given"
+
+    def test_given_invalid_values_when_build_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            build_berms_characteristic_points(np.zeros((3, 10)), n_berms=2)
+        assert (
+            str(exc_err.value) == "Expected values of shape (n, 14), (3, 10) provided"
+        )
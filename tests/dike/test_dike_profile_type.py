@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from dikesfordummies.dike.dike_profile import DikeProfile
+from dikesfordummies.dike.dike_profile_collection import DikeProfileCollection
+from dikesfordummies.dike.dike_profile_kernel import build_characteristic_points
+from dikesfordummies.dike.dike_profile_type import (
+    DikeProfileType,
+    get_profile_type,
+    register_profile_type,
+    registered_profile_types,
+)
+
+
+class TestDikeProfileType:
+    def test_given_mismatching_default_input_when_initialize_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            DikeProfileType(
+                "invalid", ["a", "b"], [0], build_characteristic_points, DikeProfile
+            )
+        assert str(exc_err.value) == "Expected 2 default values, 1 provided"
+
+    @pytest.mark.parametrize("name", registered_profile_types())
+    def test_given_registered_type_when_build_default_input_then_returns_collection(
+        self, name: str
+    ):
+        # 1. Define test data.
+        _profile_type = get_profile_type(name)
+
+        # 2. Run test.
+        _profiles = _profile_type.build([_profile_type.default_input] * 3)
+
+        # 3. Verify expectations.
+        assert isinstance(_profiles, DikeProfileCollection)
+        assert len(_profiles) == 3
+        assert _profiles.characteristic_points.shape[0] == 3
+        assert all(isinstance(_p, _profile_type.profile_class) for _p in _profiles)
+        _x = _profiles.characteristic_points[:, :, 0]
+        assert np.all(np.diff(_x, axis=1) >= 0)
+
+    def test_default_registered_types(self):
+        assert registered_profile_types()[:4] == [
+            "dike",
+            "reinforced_dike",
+            "dike_2_berms",
+            "dike_3_berms",
+        ]
+
+    def test_given_unknown_name_when_get_profile_type_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            get_profile_type("castle")
+        assert str(exc_err.value).startswith("Profile type 'castle' not registered")
+
+    def test_given_registered_name_when_register_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            register_profile_type(get_profile_type("dike"))
+        assert str(exc_err.value) == "Profile type 'dike' is already registered."
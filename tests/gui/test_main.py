@@ -1,13 +1,59 @@
+import json
+import os
 import shutil
+import subprocess
+import sys
 
 import pytest
+from PyQt5 import QtWidgets
 
 from dikesfordummies.gui.main import MainWindow
 from tests import test_results
 
+_cold_start_script = """
+import json
+import sys
+import time
+from pathlib import Path
+
+_start = time.perf_counter()
+from PyQt5 import QtWidgets
+
+if sys.argv[2] == "eager":
+    # Baseline: the workflows (and their heavy modules) imported before the window.
+    from dikesfordummies import workflows  # noqa: F401
+from dikesfordummies.gui.main import MainWindow
+
+_app = QtWidgets.QApplication([])
+_mw = MainWindow(parent=None)
+_mw.show()
+_heavy_modules = [m for m in ("numpy", "shapely", "matplotlib") if m in sys.modules]
+_app.processEvents()
+_time_to_window = time.perf_counter() - _start
+
+_mw._output_dir = Path(sys.argv[1])
+_mw._plot_profile().result()
+_time_to_first_plot = time.perf_counter() - _start
+print(
+    json.dumps(
+        dict(
+            heavy_modules=_heavy_modules,
+            time_to_window=_time_to_window,
+            time_to_first_plot=_time_to_first_plot,
+        )
+    )
+)
+"""
+
+
+@pytest.fixture
+def qt_app(monkeypatch: pytest.MonkeyPatch) -> QtWidgets.QApplication:
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
 
 class TestMainWindow:
-    def test_gui(self, request: pytest.FixtureRequest):
+    def test_gui(self, qt_app: QtWidgets.QApplication, request: pytest.FixtureRequest):
         # 1. Define test data.
         _mw = MainWindow(parent=None)
         _test_dir = test_results / request.node.name
@@ -15,8 +61,48 @@ class TestMainWindow:
 
         # 2. Run test.
         _mw._output_dir = _test_dir
-        _mw._plot_profile()
+        _mw._plot_profile().result()
 
         # 3. Verify expectations
         assert _test_dir.is_dir()
         assert any(_test_dir.glob("*.png"))
+
+    def test_cold_start(self, request: pytest.FixtureRequest):
+        # 1. Define test data.
+        _test_dir = test_results / request.node.name
+        shutil.rmtree(_test_dir, ignore_errors=True)
+        _env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        _env.pop("MPLBACKEND", None)
+
+        def run_cold_start(import_mode: str) -> dict:
+            # A new interpreter each time, so no module is imported yet.
+            _run_result = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    _cold_start_script,
+                    str(_test_dir / import_mode),
+                    import_mode,
+                ],
+                capture_output=True,
+                text=True,
+                env=_env,
+                check=True,
+                timeout=120,
+            )
+            return json.loads(_run_result.stdout.strip().splitlines()[-1])
+
+        # 2. Run test.
+        _eager_timings = run_cold_start("eager")
+        _timings = run_cold_start("lazy")
+        for _key in ["time_to_window", "time_to_first_plot"]:
+            request.node.user_properties.append((_key, _timings[_key]))
+        request.node.user_properties.append(
+            ("eager_time_to_window", _eager_timings["time_to_window"])
+        )
+
+        # 3. Verify expectations
+        assert _eager_timings["heavy_modules"]
+        assert _timings["heavy_modules"] == []
+        assert _timings["time_to_window"] < _eager_timings["time_to_window"]
+        assert (_test_dir / "lazy" / "default_plot.png").is_file()
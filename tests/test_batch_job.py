@@ -0,0 +1,233 @@
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from dikesfordummies.batch_job import BatchJobManifest, atomic_write, run_chunked_job
+from tests import test_results
+
+
+@pytest.fixture
+def test_dir(request: pytest.FixtureRequest) -> Path:
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _test_dir.mkdir(parents=True)
+    return _test_dir
+
+
+class TestAtomicWrite:
+    def test_given_failing_write_then_no_file_is_left(self, test_dir: Path):
+        # 1. Define test data.
+        _outfile = test_dir / "output.txt"
+
+        def failing_write(stream):
+            stream.write(b"partial")
+            raise RuntimeError("Preempted")
+
+        # 2. Run test.
+        with pytest.raises(RuntimeError):
+            atomic_write(_outfile, failing_write)
+
+        # 3. Verify expectations.
+        assert not any(test_dir.iterdir())
+
+    def test_given_write_then_replaces_file(self, test_dir: Path):
+        _outfile = test_dir / "output.txt"
+        _outfile.write_text("old")
+
+        atomic_write(_outfile, lambda stream: stream.write(b"new"))
+
+        assert _outfile.read_text() == "new"
+        assert list(test_dir.iterdir()) == [_outfile]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes only.")
+    def test_given_umask_when_write_then_file_gets_regular_mode(self, test_dir: Path):
+        # 1. Define test data.
+        _outfile = test_dir / "output.txt"
+        _umask = os.umask(0o027)
+
+        # 2. Run test.
+        try:
+            atomic_write(_outfile, lambda stream: stream.write(b"new"))
+        finally:
+            os.umask(_umask)
+
+        # 3. Verify expectations.
+        assert stat.S_IMODE(_outfile.stat().st_mode) == 0o640
+
+
+class TestRunChunkedJob:
+    def _get_process_chunk(self, test_dir: Path, processed: List, fail_at: int = -1):
+        def process_chunk(start: int, end: int) -> Path:
+            if start == fail_at:
+                raise RuntimeError("Preempted")
+            processed.append((start, end))
+            _outfile = test_dir / f"{start}_{end}.txt"
+            atomic_write(_outfile, lambda stream: stream.write(b"done"))
+            return _outfile
+
+        return process_chunk
+
+    def test_given_interrupted_job_when_rerun_then_skips_completed_chunks(
+        self, test_dir: Path
+    ):
+        # 1. Define test data.
+        _manifest_file = test_dir / "manifest.json"
+        _signature = dict(job="test")
+        _processed = []
+
+        # 2. Run test.
+        with pytest.raises(RuntimeError):
+            run_chunked_job(
+                10,
+                3,
+                BatchJobManifest.from_file(_manifest_file, _signature),
+                self._get_process_chunk(test_dir, _processed, fail_at=6),
+            )
+        assert _processed == [(0, 3), (3, 6)]
+        _processed.clear()
+        _outputs = run_chunked_job(
+            10,
+            3,
+            BatchJobManifest.from_file(_manifest_file, _signature),
+            self._get_process_chunk(test_dir, _processed),
+        )
+
+        # 3. Verify expectations.
+        assert _processed == [(6, 9), (9, 10)]
+        assert [_o.name for _o in _outputs] == [
+            "0_3.txt",
+            "3_6.txt",
+            "6_9.txt",
+            "9_10.txt",
+        ]
+
+    def test_given_missing_output_when_rerun_then_processes_chunk_again(
+        self, test_dir: Path
+    ):
+        # 1. Define test data.
+        _manifest_file = test_dir / "manifest.json"
+        _processed = []
+        run_chunked_job(
+            4,
+            2,
+            BatchJobManifest.from_file(_manifest_file, {}),
+            self._get_process_chunk(test_dir, _processed),
+        )
+        (test_dir / "2_4.txt").unlink()
+        _processed.clear()
+
+        # 2. Run test.
+        run_chunked_job(
+            4,
+            2,
+            BatchJobManifest.from_file(_manifest_file, {}),
+            self._get_process_chunk(test_dir, _processed),
+        )
+
+        # 3. Verify expectations.
+        assert _processed == [(2, 4)]
+
+    def test_given_extra_outputs_when_run_then_records_them(self, test_dir: Path):
+        # 1. Define test data.
+        _manifest_file = test_dir / "manifest.json"
+
+        def process_chunk(start: int, end: int):
+            _outfile = test_dir / f"{start}_{end}.txt"
+            _ids_file = test_dir / f"ids_{start}_{end}.txt"
+            for _file in [_outfile, _ids_file]:
+                atomic_write(_file, lambda stream: stream.write(b"done"))
+            return _outfile, dict(ids=_ids_file)
+
+        # 2. Run test.
+        run_chunked_job(
+            4, 2, BatchJobManifest.from_file(_manifest_file, {}), process_chunk
+        )
+
+        # 3. Verify expectations.
+        _manifest = BatchJobManifest.from_file(_manifest_file)
+        assert [_o.name for _o in _manifest.get_outputs("ids")] == [
+            "ids_0_2.txt",
+            "ids_2_4.txt",
+        ]
+        (test_dir / "ids_2_4.txt").unlink()
+        assert _manifest.is_completed(0, 2)
+        assert not _manifest.is_completed(2, 4)
+        with pytest.raises(ValueError):
+            _manifest.get_outputs("other")
+
+    def test_given_no_items_when_run_then_saves_manifest(self, test_dir: Path):
+        _manifest_file = test_dir / "manifest.json"
+
+        _outputs = run_chunked_job(
+            0, 2, BatchJobManifest.from_file(_manifest_file, {}), None
+        )
+
+        assert _outputs == []
+        assert BatchJobManifest.from_file(_manifest_file).covers(0)
+
+    def test_given_invalid_chunk_size_then_raises(self, test_dir: Path):
+        with pytest.raises(ValueError) as exc_err:
+            run_chunked_job(
+                4, 0, BatchJobManifest.from_file(test_dir / "m.json", {}), None
+            )
+        assert str(exc_err.value) == "Chunk size should be greater than 0, 0 given."
+
+
+class TestBatchJobManifest:
+    def test_given_manifest_of_other_job_when_from_file_then_raises(
+        self, test_dir: Path
+    ):
+        # 1. Define test data.
+        _manifest_file = test_dir / "manifest.json"
+        BatchJobManifest.from_file(_manifest_file, dict(job="a")).save()
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            BatchJobManifest.from_file(_manifest_file, dict(job="b"))
+
+        # 3. Verify expectations.
+        assert "belongs to a different job" in str(exc_err.value)
+
+    def test_given_no_signature_when_from_file_then_reads_existing_job(
+        self, test_dir: Path
+    ):
+        # 1. Define test data.
+        _manifest_file = test_dir / "manifest.json"
+        BatchJobManifest.from_file(_manifest_file, dict(job="a")).save()
+
+        # 2. Run test.
+        _manifest = BatchJobManifest.from_file(_manifest_file)
+
+        # 3. Verify expectations.
+        assert _manifest.job_signature == dict(job="a")
+        with pytest.raises(ValueError) as exc_err:
+            BatchJobManifest.from_file(test_dir / "missing.json")
+        assert "not found" in str(exc_err.value)
+
+    @pytest.mark.parametrize(
+        "chunks, n_items, expected",
+        [
+            pytest.param([(0, 2), (2, 4)], 4, True, id="Complete"),
+            pytest.param([(2, 4), (0, 2)], 4, True, id="Unsorted"),
+            pytest.param([(0, 2)], 4, False, id="Missing last chunk"),
+            pytest.param([(0, 2), (3, 4)], 4, False, id="Gap"),
+            pytest.param([(0, 2), (0, 3), (3, 4)], 4, False, id="Overlap"),
+            pytest.param([], 0, True, id="No items"),
+        ],
+    )
+    def test_given_chunks_when_covers_then_returns_expected(
+        self, chunks: list, n_items: int, expected: bool, test_dir: Path
+    ):
+        # 1. Define test data.
+        _manifest = BatchJobManifest.from_file(test_dir / "manifest.json", {})
+        for _start, _end in chunks:
+            _output = test_dir / f"{_start}_{_end}.npy"
+            _output.touch()
+            _manifest.mark_completed(_start, _end, _output)
+
+        # 2. Run test & 3. Verify expectations.
+        assert _manifest.covers(n_items) == expected
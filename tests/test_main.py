@@ -1,9 +1,11 @@
 import shutil
 
+import numpy as np
 import pytest
 from click.testing import CliRunner
 
-from dikesfordummies import main
+from dikesfordummies import main, workflows
+from dikesfordummies.dike.dike_profile_type import registered_profile_types
 from tests import test_results
 
 
@@ -21,3 +23,245 @@ def test_given_valid_input_generates_default_profile(request: pytest.FixtureRequ
     # 3. Verify expectations.
     assert _run_result.exit_code == 0
     assert _test_file.is_file()
+
+
+@pytest.mark.parametrize("profile_type", registered_profile_types())
+def test_given_profile_type_generates_default_profile(
+    profile_type: str, request: pytest.FixtureRequest
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    _test_file = _test_dir / "profile.png"
+
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _args = ["--profile_type", profile_type, "--outfile", _test_file]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.plot_profile, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code == 0
+    assert _test_file.is_file()
+
+
+def test_given_mismatching_input_for_profile_type_then_fails():
+    # 1. Define test data.
+    _args = ["--profile_type", "dike_2_berms", "--dike_input", ",".join(["1"] * 10)]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.plot_profile, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code != 0
+    assert "Profile type 'dike_2_berms' expects 14 values" in _run_result.output
+    assert "10 provided" in _run_result.output
+
+
+@pytest.mark.parametrize(
+    "profile_type, dike_input",
+    [
+        pytest.param("dike", "0,3,0,0,6,5,3,0,0,0", id="dike"),
+        pytest.param("dike_2_berms", "0,3,1,2,3,2,6,5,3,3,2,1,2,0", id="dike_2_berms"),
+        pytest.param(
+            "dike_3_berms", "0 3 1 2 2 2 3 2 6 5 3 3 2 2 2 1 2 0", id="dike_3_berms"
+        ),
+    ],
+)
+def test_given_dike_input_for_profile_type_generates_profile(
+    profile_type: str, dike_input: str, request: pytest.FixtureRequest
+):
+    # 1. Define test data.
+    _test_file = test_results / request.node.name / "profile.png"
+    shutil.rmtree(_test_file.parent, ignore_errors=True)
+    _args = [
+        "--profile_type",
+        profile_type,
+        "--dike_input",
+        dike_input,
+        "--outfile",
+        _test_file,
+    ]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.plot_profile, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code == 0, _run_result.output
+    assert _test_file.is_file()
+
+
+@pytest.mark.parametrize(
+    "dike_input",
+    [
+        pytest.param(["0", "3", "0", "0", "6", "5", "3", "0", "0", "0"], id="Spaces"),
+        pytest.param(
+            ["-1", "3", "0", "0", "6", "5", "3", "0", "0", "-1"], id="Negative"
+        ),
+        pytest.param(["0,3,0,0,6", "5", "3", "0,0,0"], id="Mixed"),
+    ],
+)
+def test_given_separate_dike_input_values_generates_profile(
+    dike_input: list, request: pytest.FixtureRequest
+):
+    # 1. Define test data.
+    _test_file = test_results / request.node.name / "profile.png"
+    shutil.rmtree(_test_file.parent, ignore_errors=True)
+    _args = ["--dike_input", *dike_input, "--outfile", _test_file]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.plot_profile, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code == 0, _run_result.output
+    assert _test_file.is_file()
+
+
+def test_given_non_numeric_dike_input_then_fails():
+    _run_result = CliRunner().invoke(main.plot_profile, ["--dike_input", "0,a"])
+
+    assert _run_result.exit_code != 0
+    assert "Expected numeric values, '0,a' provided." in _run_result.output
+
+
+def test_given_input_file_when_export_profiles_then_exports_chunks(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _test_dir.mkdir(parents=True)
+    _input_file = _test_dir / "inputs.csv"
+    _input_file.write_text("\n".join(["0,3,0,0,6,5,3,0,0,0"] * 5))
+    _output_dir = _test_dir / "profiles"
+    _args = [
+        "--input_file",
+        _input_file,
+        "--output_dir",
+        _output_dir,
+        "--chunk_size",
+        2,
+    ]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.export_profiles, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code == 0
+    assert len(list(_output_dir.glob("*.npy"))) == 3
+    assert (_output_dir / "manifest.json").is_file()
+
+
+def test_given_id_column_when_export_profiles_then_exports_ids(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _test_dir.mkdir(parents=True)
+    _input_file = _test_dir / "inputs.csv"
+    _input_file.write_text(
+        "\n".join(f"{_id * 50},0,3,0,0,6,5,3,0,0,0" for _id in range(5))
+    )
+    _output_dir = _test_dir / "profiles"
+    _args = [
+        "--input_file",
+        _input_file,
+        "--output_dir",
+        _output_dir,
+        "--chunk_size",
+        2,
+        "--id_column",
+    ]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.export_profiles, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code == 0, _run_result.output
+    assert len(list(_output_dir.glob("profiles_*.npy"))) == 3
+    _ids = np.concatenate([np.load(_f) for _f in sorted(_output_dir.glob("ids_*"))])
+    assert _ids.tolist() == [0, 50, 100, 150, 200]
+
+
+def test_given_profile_memory_when_plot_profile_then_reports_memory(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_file = test_results / request.node.name / "profile.png"
+    _args = ["--outfile", _test_file, "--profile_memory"]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.plot_profile, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code == 0
+    assert "Peak memory: " in _run_result.output
+    for _stage in ["input_parsing", "profile_building", "plotting"]:
+        assert f"{_stage}: peak " in _run_result.output
+
+
+def test_given_n_profiles_when_estimate_memory_then_reports_projection():
+    _args = ["--n_profiles", 10**6, "--calibration_size", 1000]
+
+    _run_result = CliRunner().invoke(main.estimate_memory, _args)
+
+    assert _run_result.exit_code == 0
+    assert "Projected peak memory for building 1000000 profiles: " in (
+        _run_result.output
+    )
+
+
+def test_given_export_dirs_when_diff_profiles_then_writes_report(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    for _name in ["base", "other"]:
+        workflows.export_dike_profiles(
+            [list(main._default_input.values())], _test_dir / _name
+        )
+    _report = _test_dir / "diff.csv"
+    _args = [
+        "--base_dir",
+        _test_dir / "base",
+        "--other_dir",
+        _test_dir / "other",
+        "--outfile",
+        _report,
+    ]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.diff_profiles, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code == 0
+    assert "0 differing sections" in _run_result.output
+    assert _report.is_file()
+
+
+def test_given_dir_without_export_when_diff_profiles_then_fails(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    (_test_dir / "other").mkdir(parents=True)
+    workflows.export_dike_profiles(
+        [list(main._default_input.values())], _test_dir / "base"
+    )
+    _args = [
+        "--base_dir",
+        _test_dir / "base",
+        "--other_dir",
+        _test_dir / "other",
+        "--outfile",
+        _test_dir / "diff.csv",
+    ]
+
+    # 2. Run test.
+    _run_result = CliRunner().invoke(main.diff_profiles, _args)
+
+    # 3. Verify expectations.
+    assert _run_result.exit_code != 0
+    assert "manifest.json not found" in _run_result.output
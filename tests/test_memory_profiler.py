@@ -0,0 +1,99 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from dikesfordummies.memory_profiler import (
+    MemoryProfiler,
+    profile_stage,
+    project_peak_memory,
+)
+
+
+class TestMemoryProfiler:
+    def test_given_stages_when_profiling_then_reports_peak_per_stage(self):
+        # 1. Define test data.
+        _n_bytes = 8 * 10**6
+
+        # 2. Run test.
+        with MemoryProfiler() as _profiler:
+            with _profiler.stage("small"):
+                _small = np.ones(10)
+            with _profiler.stage("large"):
+                _large = np.ones(_n_bytes // 8)
+                del _large
+
+        # 3. Verify expectations.
+        assert not tracemalloc.is_tracing()
+        assert list(_profiler.stages.keys()) == ["small", "large"]
+        assert _profiler.stages["large"].peak_bytes >= _n_bytes
+        assert _profiler.stages["small"].peak_bytes < _n_bytes
+        assert _profiler.peak_bytes >= _n_bytes
+        _report = _profiler.report()
+        assert _report.startswith("Peak memory: ")
+        assert "large: peak " in _report
+
+    def test_given_retained_allocations_then_reports_top_sites(self):
+        with MemoryProfiler() as _profiler:
+            with _profiler.stage("retained"):
+                _retained = np.ones(10**5)
+
+        _stage_report = _profiler.stages["retained"]
+        assert _stage_report.allocated_bytes >= 8 * 10**5
+        assert _stage_report.top_sites
+        assert all(":" in _site for _site in _stage_report.top_sites)
+
+    def test_given_empty_stages_then_profiler_overhead_is_not_reported(self):
+        # 1. Define test data.
+        def run(n_stages: int) -> MemoryProfiler:
+            with MemoryProfiler() as _profiler:
+                _heap = [object() for _ in range(300000)]
+                for _stage in range(n_stages):
+                    with _profiler.stage(f"stage_{_stage}"):
+                        pass
+            return _profiler
+
+        # 2. Run test.
+        _without_stages = run(0)
+        _with_stages = run(3)
+
+        # 3. Verify expectations.
+        assert _with_stages.peak_bytes == pytest.approx(
+            _without_stages.peak_bytes, rel=0.01
+        )
+        for _stage in _with_stages.stages.values():
+            assert _stage.peak_bytes < 1024
+            assert not _stage.top_sites
+
+    def test_given_no_active_profiler_when_stage_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            with MemoryProfiler().stage("stage"):
+                pass
+        assert (
+            str(exc_err.value) == "MemoryProfiler should be used as a context manager."
+        )
+
+    def test_given_no_profiler_when_profile_stage_then_does_nothing(self):
+        with profile_stage(None, "stage"):
+            pass
+
+
+class TestProjectPeakMemory:
+    def test_given_linear_run_then_projects_peak(self):
+        # 1. Define test data.
+        def run(n_items: int):
+            np.ones(n_items)
+
+        # 2. Run test.
+        _projected = project_peak_memory(run, 10**6, [10**4, 10**5])
+
+        # 3. Verify expectations.
+        assert _projected == pytest.approx(8 * 10**6, rel=0.05)
+
+    def test_given_single_calibration_size_then_raises(self):
+        with pytest.raises(ValueError) as exc_err:
+            project_peak_memory(lambda _: None, 10, [5, 5])
+        assert (
+            str(exc_err.value)
+            == "At least two different calibration sizes are required."
+        )
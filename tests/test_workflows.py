@@ -0,0 +1,222 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from dikesfordummies import workflows
+from dikesfordummies.dike.dike_profile_type import get_profile_type
+from tests import test_results
+
+
+def test_given_inputs_when_export_dike_profiles_then_exports_chunks(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _inputs = np.random.default_rng(42).uniform(0, 10, (25, 10))
+
+    # 2. Run test.
+    _outputs = workflows.export_dike_profiles(_inputs, _test_dir, chunk_size=10)
+
+    # 3. Verify expectations.
+    assert [_o.name for _o in _outputs] == [
+        "profiles_000000000_000000010.npy",
+        "profiles_000000010_000000020.npy",
+        "profiles_000000020_000000025.npy",
+    ]
+    assert (_test_dir / "manifest.json").is_file()
+    assert np.array_equal(
+        np.concatenate([np.load(_o) for _o in _outputs]),
+        get_profile_type("dike").build(_inputs).characteristic_points,
+    )
+    assert workflows.export_dike_profiles(_inputs, _test_dir, chunk_size=10) == (
+        _outputs
+    )
+
+
+def test_given_other_inputs_when_export_dike_profiles_in_same_dir_then_raises(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    workflows.export_dike_profiles(np.zeros((2, 10)), _test_dir)
+
+    # 2. Run test.
+    with pytest.raises(ValueError) as exc_err:
+        workflows.export_dike_profiles(np.ones((2, 10)), _test_dir)
+
+    # 3. Verify expectations.
+    assert "belongs to a different job" in str(exc_err.value)
+
+
+def test_given_exports_when_diff_dike_profile_exports_then_writes_report(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _inputs = np.tile(get_profile_type("dike").default_input, (5, 1)).astype(float)
+    workflows.export_dike_profiles(_inputs, _test_dir / "base", chunk_size=2)
+    _inputs[3, 5] += 3
+    workflows.export_dike_profiles(_inputs[:4], _test_dir / "other", chunk_size=3)
+    _report = _test_dir / "diff.csv"
+
+    # 2. Run test.
+    _n_reported = workflows.diff_dike_profile_exports(
+        _test_dir / "base", _test_dir / "other", _report, chunk_size=2
+    )
+
+    # 3. Verify expectations.
+    assert _n_reported == 2
+    assert _report.read_text().splitlines() == [
+        "section,status,max_vertical_offset,area_difference",
+        "3,changed,1.0,18.0",
+        "4,only_in_base,,",
+    ]
+
+
+def test_given_stale_chunks_when_diff_dike_profile_exports_then_only_reads_manifest(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _inputs = np.tile(get_profile_type("dike").default_input, (6, 1)).astype(float)
+    workflows.export_dike_profiles(_inputs, _test_dir / "base", chunk_size=3)
+    (_test_dir / "base" / "manifest.json").unlink()
+    workflows.export_dike_profiles(_inputs, _test_dir / "base", chunk_size=4)
+    workflows.export_dike_profiles(_inputs, _test_dir / "other", chunk_size=4)
+    _report = _test_dir / "diff.csv"
+
+    # 2. Run test.
+    _n_reported = workflows.diff_dike_profile_exports(
+        _test_dir / "base", _test_dir / "other", _report
+    )
+
+    # 3. Verify expectations.
+    assert len(list((_test_dir / "base").glob("profiles_*.npy"))) == 4
+    assert _n_reported == 0
+
+
+@pytest.mark.parametrize(
+    "remove_file",
+    [
+        pytest.param("manifest.json", id="No manifest"),
+        pytest.param("profiles_000000002_000000004.npy", id="Missing chunk"),
+    ],
+)
+def test_given_incomplete_export_when_diff_dike_profile_exports_then_raises(
+    remove_file: str, request: pytest.FixtureRequest
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _inputs = np.tile(get_profile_type("dike").default_input, (5, 1)).astype(float)
+    workflows.export_dike_profiles(_inputs, _test_dir / "base", chunk_size=2)
+    workflows.export_dike_profiles(_inputs, _test_dir / "other", chunk_size=2)
+    (_test_dir / "other" / remove_file).unlink()
+
+    # 2. Run test.
+    with pytest.raises(ValueError):
+        workflows.diff_dike_profile_exports(
+            _test_dir / "base", _test_dir / "other", _test_dir / "diff.csv"
+        )
+
+    # 3. Verify expectations.
+    assert not (_test_dir / "diff.csv").exists()
+
+
+def test_given_no_inputs_when_export_dike_profiles_then_can_be_diffed(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    for _name in ["base", "other"]:
+        workflows.export_dike_profiles(np.empty((0, 10)), _test_dir / _name)
+
+    # 2. Run test.
+    _n_reported = workflows.diff_dike_profile_exports(
+        _test_dir / "base", _test_dir / "other", _test_dir / "diff.csv"
+    )
+
+    # 3. Verify expectations.
+    assert (_test_dir / "base" / "manifest.json").is_file()
+    assert _n_reported == 0
+
+
+def test_given_inserted_section_when_diff_dike_profile_exports_with_ids_then_aligns_by_id(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _base_inputs = np.tile(get_profile_type("dike").default_input, (6, 1)).astype(float)
+    _base_inputs[:, 4] += np.arange(6)
+    _base_ids = np.arange(6) * 100.0
+    # A section is inserted at chainage 250, and the one at 400 is removed.
+    _other_inputs = np.insert(np.delete(_base_inputs, 4, axis=0), 3, _base_inputs[0], 0)
+    _other_ids = np.array([0.0, 100.0, 200.0, 250.0, 300.0, 500.0])
+    workflows.export_dike_profiles(
+        _base_inputs, _test_dir / "base", chunk_size=4, section_ids=_base_ids
+    )
+    workflows.export_dike_profiles(
+        _other_inputs, _test_dir / "other", chunk_size=3, section_ids=_other_ids
+    )
+    _report = _test_dir / "diff.csv"
+
+    # 2. Run test.
+    _n_reported = workflows.diff_dike_profile_exports(
+        _test_dir / "base", _test_dir / "other", _report, chunk_size=2
+    )
+
+    # 3. Verify expectations.
+    assert _n_reported == 2
+    assert _report.read_text().splitlines() == [
+        "section,status,max_vertical_offset,area_difference",
+        "250.0,only_in_other,,",
+        "400.0,only_in_base,,",
+    ]
+
+
+@pytest.mark.parametrize(
+    "section_ids",
+    [
+        pytest.param([0, 2, 1], id="Unsorted"),
+        pytest.param([0, 1, 1], id="Repeated"),
+        pytest.param([0, 1], id="Too few"),
+    ],
+)
+def test_given_invalid_section_ids_when_export_dike_profiles_then_raises(
+    section_ids: list, request: pytest.FixtureRequest
+):
+    with pytest.raises(ValueError):
+        workflows.export_dike_profiles(
+            np.zeros((3, 10)),
+            test_results / request.node.name,
+            section_ids=np.array(section_ids),
+        )
+
+
+def test_given_only_one_export_with_ids_when_diff_dike_profile_exports_then_raises(
+    request: pytest.FixtureRequest,
+):
+    # 1. Define test data.
+    _test_dir = test_results / request.node.name
+    shutil.rmtree(_test_dir, ignore_errors=True)
+    _inputs = np.tile(get_profile_type("dike").default_input, (3, 1)).astype(float)
+    workflows.export_dike_profiles(
+        _inputs, _test_dir / "base", section_ids=np.arange(3)
+    )
+    workflows.export_dike_profiles(_inputs, _test_dir / "other")
+
+    # 2. Run test.
+    with pytest.raises(ValueError) as exc_err:
+        workflows.diff_dike_profile_exports(
+            _test_dir / "base", _test_dir / "other", _test_dir / "diff.csv"
+        )
+
+    # 3. Verify expectations.
+    assert "has section ids" in str(exc_err.value)